@@ -8,6 +8,7 @@ import queue
 import signal
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Optional
 
 import numpy as np
@@ -41,6 +42,29 @@ from app.ui import OnboardingWizard, SettingsWindow, ToastManager
 
 LOGGER = logging.getLogger("hoppy_whisper")
 
+_LOG_FORMATTER = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+
+class _PendingTimer(threading.Timer):
+    """Timer that tracks whether it is still pending with a plain flag.
+
+    Lets callers cancel without querying thread liveness, which takes the
+    thread state lock on every check.
+    """
+
+    pending = True
+
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            self.pending = False
+
+    def cancel(self) -> None:
+        if self.pending:
+            self.pending = False
+            super().cancel()
+
 
 class AppRuntime:
     """High-level coordinator that wires the tray and hotkey subsystems."""
@@ -52,8 +76,8 @@ class AppRuntime:
         self._transcriber = transcriber
         self._stop_event = threading.Event()
         self._recording_active = False
-        self._transcribe_timer: Optional[threading.Timer] = None
-        self._idle_timer: Optional[threading.Timer] = None
+        self._transcribe_timer: Optional[_PendingTimer] = None
+        self._idle_timer: Optional[_PendingTimer] = None
         self._app_name = "Hoppy Whisper"
         self._startup_command = startup.resolve_startup_command()
         # VAD state
@@ -62,7 +86,13 @@ class AppRuntime:
         self._vad_stop_requested = False
 
         self._audio_recorder = AudioRecorder()
-        self._audio_buffer: Optional[np.ndarray] = None
+        # Bumped when recording starts; work queued for an older recording is
+        # dropped, since the I/O worker may run it after a new one has begun
+        self._recording_session = 0
+        # Single worker for WAV writes and inference, off the hotkey thread
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hoppy-io"
+        )
         self._keyboard_controller = Controller()
         self._history = HistoryDAO(
             default_history_db_path(),
@@ -193,6 +223,7 @@ class AppRuntime:
         self._stop_event.set()
         self._cancel_timer(self._transcribe_timer)
         self._cancel_timer(self._idle_timer)
+        self._io_executor.shutdown(wait=False)
         self._hotkey.stop()
         self._tray.stop()
         self._history.close()
@@ -344,6 +375,7 @@ class AppRuntime:
             return
         LOGGER.debug("Hotkey pressed: start recording")
         self._recording_active = True
+        self._recording_session += 1
         self._cancel_timer(self._transcribe_timer)
         self._cancel_timer(self._idle_timer)
 
@@ -401,11 +433,32 @@ class AppRuntime:
         metrics.start("ptt_release_to_paste")
 
         try:
-            self._audio_buffer = self._audio_recorder.stop()
-            # Calculate duration from returned buffer
-            buffer_samples = (
-                len(self._audio_buffer) if self._audio_buffer is not None else 0
+            audio_buffer = self._audio_recorder.stop()
+        except Exception as exc:
+            LOGGER.exception("Failed to stop audio capture", exc_info=exc)
+            self._toast_manager.error(
+                "Could not complete audio capture.",
+                "Recording Error",
             )
+            self._tray.set_state(TrayState.ERROR)
+            self._schedule_idle_reset()
+            return
+
+        # Finish on the I/O worker so the hotkey callback returns promptly
+        self._submit_io(self._finalize_recording, audio_buffer, self._recording_session)
+
+    def _finalize_recording(self, audio_buffer: np.ndarray, session: int) -> None:
+        """Validate the captured buffer and schedule transcription.
+
+        Runs on the I/O worker thread. Does nothing if another recording has
+        started since ``session`` stopped.
+        """
+        if session != self._recording_session:
+            LOGGER.debug("Recording superseded before finalizing; dropping it")
+            return
+        try:
+            # Calculate duration from returned buffer
+            buffer_samples = len(audio_buffer) if audio_buffer is not None else 0
             duration = buffer_samples / self._audio_recorder.sample_rate
             LOGGER.info(
                 "Captured %.2f seconds of audio (%d samples)", duration, buffer_samples
@@ -425,12 +478,14 @@ class AppRuntime:
 
             self._tray.set_state(TrayState.TRANSCRIBING)
             delay = self._settings.transcribe_start_delay_ms / 1000.0
-            self._transcribe_timer = threading.Timer(
-                delay, self._complete_transcription
+            self._transcribe_timer = _PendingTimer(
+                delay,
+                self._submit_io,
+                args=(self._complete_transcription, audio_buffer, session),
             )
             self._transcribe_timer.start()
         except Exception as exc:
-            LOGGER.exception("Failed to stop audio capture", exc_info=exc)
+            LOGGER.exception("Failed to finalize audio capture", exc_info=exc)
             self._toast_manager.error(
                 "Could not complete audio capture.",
                 "Recording Error",
@@ -438,9 +493,26 @@ class AppRuntime:
             self._tray.set_state(TrayState.ERROR)
             self._schedule_idle_reset()
 
-    def _complete_transcription(self) -> None:
-        """Transcribe the audio buffer and copy to clipboard."""
-        if self._audio_buffer is None:
+    def _submit_io(self, task: Callable[..., None], *args: object) -> None:
+        """Queue a task on the I/O worker unless the runtime is shutting down."""
+        if self._stop_event.is_set():
+            return
+        try:
+            self._io_executor.submit(task, *args)
+        except RuntimeError:
+            LOGGER.debug("I/O worker unavailable; dropping task", exc_info=True)
+
+    def _complete_transcription(
+        self, audio_buffer: Optional[np.ndarray], session: int
+    ) -> None:
+        """Transcribe the audio buffer and copy to clipboard.
+
+        Skipped if another recording has started since ``session`` stopped.
+        """
+        if session != self._recording_session:
+            LOGGER.debug("Recording superseded before transcription; dropping it")
+            return
+        if audio_buffer is None:
             LOGGER.error("No audio buffer to transcribe")
             self._toast_manager.error(
                 "No audio recorded. Please try recording again.",
@@ -451,13 +523,19 @@ class AppRuntime:
             return
 
         try:
-            # Use TempWavFile to create a temporary WAV for transcription
-            with TempWavFile(
-                self._audio_buffer,
-                self._audio_recorder.sample_rate,
-                cleanup=True,
-            ) as wav_path:
-                result = self._transcriber.transcribe_file(wav_path)
+            if isinstance(self._transcriber, HoppyTranscriber):
+                # Local inference takes the waveform directly; no WAV round-trip
+                result = self._transcriber.transcribe_audio(
+                    audio_buffer, self._audio_recorder.sample_rate
+                )
+            else:
+                # Use TempWavFile to create a temporary WAV for upload
+                with TempWavFile(
+                    audio_buffer,
+                    self._audio_recorder.sample_rate,
+                    cleanup=True,
+                ) as wav_path:
+                    result = self._transcriber.transcribe_file(wav_path)
 
             LOGGER.info(
                 "Transcription completed in %.0f ms: '%s'",
@@ -620,12 +698,12 @@ class AppRuntime:
     def _on_audio_chunk(self, chunk: np.ndarray) -> None:
         """Incrementally feed captured audio to VAD and auto-stop on trailing silence.
 
-        Runs on the PortAudio callback thread; keep work minimal.
+        Runs on the recorder's frame-drain thread, off the PortAudio callback.
         """
         if self._vad is None or not self._recording_active:
             return
         try:
-            data = chunk.flatten()
+            data = chunk.reshape(-1)
             if self._vad_carry.size:
                 data = np.concatenate((self._vad_carry, data))
             frame_size = self._vad.frame_size  # 30ms @ 16kHz = 480 samples
@@ -684,15 +762,15 @@ class AppRuntime:
         self._cancel_timer(self._idle_timer)
         if delay is None:
             delay = self._settings.idle_reset_delay_ms / 1000.0
-        self._idle_timer = threading.Timer(delay, self._reset_to_idle)
+        self._idle_timer = _PendingTimer(delay, self._reset_to_idle)
         self._idle_timer.start()
 
     def _reset_to_idle(self) -> None:
         LOGGER.debug("Resetting tray state to idle")
         self._tray.set_state(TrayState.IDLE)
 
-    def _cancel_timer(self, timer: Optional[threading.Timer]) -> None:
-        if timer and timer.is_alive():
+    def _cancel_timer(self, timer: Optional[_PendingTimer]) -> None:
+        if timer is not None:
             timer.cancel()
 
     def _apply_startup_setting(self, enabled: bool) -> bool:
@@ -785,7 +863,14 @@ def configure_logging() -> None:
     level_name = os.getenv("HOPPY_WHISPER_LOG_LEVEL", "INFO").upper()
     console_level = getattr(logging, level_name, logging.INFO)
 
-    fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    # The format only uses time, level, logger name and message; skip collecting
+    # thread/process info and the caller stack walk for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None  # type: ignore[attr-defined]
+
+    fmt = _LOG_FORMATTER
 
     handlers: list[logging.Handler] = []
 
@@ -56,7 +56,7 @@ def write_wav(
         sample_rate: Audio sample rate in Hz
         channels: Number of audio channels (default: 1 for mono)
     """
-    file_path = Path(file_path)
+    path_str = os.fspath(file_path)
 
     # Convert to int16 if needed
     if audio.dtype == np.float32 or audio.dtype == np.float64:
@@ -75,20 +75,40 @@ def write_wav(
         )
 
     try:
-        with wave.open(str(file_path), "wb") as wav_file:
+        with wave.open(path_str, "wb") as wav_file:
             wav_file.setnchannels(channels)
             wav_file.setsampwidth(2)  # 2 bytes for int16
             wav_file.setframerate(sample_rate)
             wav_file.writeframes(audio_int16.tobytes())
 
         LOGGER.debug(
-            "Wrote WAV file: %s (%d samples, %d Hz)", file_path, len(audio), sample_rate
+            "Wrote WAV file: %s (%d samples, %d Hz)", path_str, len(audio), sample_rate
         )
     except Exception as exc:
-        LOGGER.error("Failed to write WAV file %s: %s", file_path, exc)
+        LOGGER.error("Failed to write WAV file %s: %s", path_str, exc)
         raise
 
 
+def _open_anonymous_tempfile() -> Optional[int]:
+    """
+    Open an unnamed temp file with O_TMPFILE (Linux) and return its descriptor.
+
+    The file never gets a directory entry and is reclaimed by the kernel when
+    the descriptor closes. Returns None where O_TMPFILE or /proc is unavailable.
+    """
+    flag = getattr(os, "O_TMPFILE", None)
+    if flag is None:
+        return None
+    try:
+        fd = os.open(tempfile.gettempdir(), flag | os.O_RDWR, 0o600)
+    except OSError:
+        return None
+    if not os.path.exists(f"/proc/self/fd/{fd}"):
+        os.close(fd)
+        return None
+    return fd
+
+
 class TempWavFile:
     """
     Context manager for temporary WAV files with automatic cleanup.
@@ -128,15 +148,26 @@ class TempWavFile:
         self._suffix = suffix
         self._file_path: Optional[Path] = None
         self._fd: Optional[int] = None
+        self._anonymous = False
 
     def __enter__(self) -> Path:
         """Create and write the temporary WAV file."""
-        # Create temp file with a file descriptor to prevent race conditions
-        self._fd, temp_path = tempfile.mkstemp(prefix=self._prefix, suffix=self._suffix)
+        # Prefer an unnamed O_TMPFILE file when it will be discarded anyway;
+        # it avoids creating and unlinking a directory entry per recording
+        fd = _open_anonymous_tempfile() if self._cleanup else None
+        if fd is not None:
+            self._fd = fd
+            self._anonymous = True
+            temp_path = f"/proc/self/fd/{fd}"
+        else:
+            # Create temp file with a file descriptor to prevent race conditions
+            self._fd, temp_path = tempfile.mkstemp(
+                prefix=self._prefix, suffix=self._suffix
+            )
 
         try:
             self._file_path = Path(temp_path)
-            write_wav(self._file_path, self._audio, self._sample_rate, self._channels)
+            write_wav(temp_path, self._audio, self._sample_rate, self._channels)
             LOGGER.debug("Created temp WAV: %s", self._file_path)
             return self._file_path
         except Exception:
@@ -144,7 +175,7 @@ class TempWavFile:
             if self._fd is not None:
                 os.close(self._fd)
                 self._fd = None
-            if self._file_path and self._file_path.exists():
+            if not self._anonymous and self._file_path and self._file_path.exists():
                 self._file_path.unlink()
             raise
 
@@ -159,8 +190,8 @@ class TempWavFile:
             finally:
                 self._fd = None
 
-        # Delete file if cleanup requested
-        if self._cleanup and self._file_path:
+        # Delete file if cleanup requested (anonymous files vanish on close)
+        if self._cleanup and self._file_path and not self._anonymous:
             try:
                 if self._file_path.exists():
                     self._file_path.unlink()
@@ -187,24 +218,28 @@ def save_audio_buffer(
     Returns:
         Path to the written file
     """
-    output_path = Path(output_path)
     write_wav(output_path, audio, sample_rate, channels)
-    return output_path
+    return output_path if isinstance(output_path, Path) else Path(output_path)
 
 
-def audio_buffer_to_pcm16_bytes(audio: np.ndarray) -> bytes:
+def audio_buffer_to_pcm16_bytes(audio: np.ndarray) -> bytes | memoryview:
     """
     Convert audio buffer to PCM16 bytes for inference.
 
+    Contiguous int16 input is returned as a zero-copy ``memoryview`` over the
+    array's memory; all other input is converted and returned as ``bytes``.
+
     Args:
         audio: Float32 or int16 audio array
 
     Returns:
-        PCM16 bytes
+        PCM16 bytes-like object
     """
     if audio.dtype == np.float32 or audio.dtype == np.float64:
         pcm16 = float32_to_pcm16(audio)
     elif audio.dtype == np.int16:
+        if audio.flags.c_contiguous:
+            return memoryview(audio.view(np.int16)).cast("B")
         pcm16 = audio
     else:
         raise ValueError(f"Unsupported audio dtype: {audio.dtype}")
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import sys
 import threading
 import time
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 import numpy as np
 import sounddevice as sd
@@ -18,6 +19,32 @@ SAMPLE_RATE = 16000
 CHANNELS = 1
 DTYPE = np.float32
 BLOCKSIZE = 512  # ~32 ms per callback at 16 kHz
+MAX_RECORDING_SECONDS = 3600  # hard cap on buffered audio (~230 MB at 16 kHz)
+DEVICE_CACHE_TTL = 5.0  # seconds to reuse a PortAudio device enumeration
+
+_device_cache: Optional[tuple[float, Any]] = None
+
+
+def _cached_query_devices(ttl: float = DEVICE_CACHE_TTL) -> Any:
+    """Return ``sd.query_devices()``, reusing a recent enumeration.
+
+    Host API enumeration can take tens of milliseconds on WASAPI, and every
+    recording start would otherwise repeat it.
+    """
+    global _device_cache
+    now = time.monotonic()
+    cached = _device_cache
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    devices = sd.query_devices()
+    _device_cache = (now, devices)
+    return devices
+
+
+def invalidate_device_cache() -> None:
+    """Forget the cached device list so the next query re-enumerates."""
+    global _device_cache
+    _device_cache = None
 
 
 class AudioRecorder:
@@ -36,11 +63,24 @@ class AudioRecorder:
         self._dtype = dtype
         self._blocksize = blocksize
         self._stream: Optional[sd.InputStream] = None
-        self._buffer: list[np.ndarray] = []
-        self._lock = threading.Lock()
+        # Preallocated capture buffer shared without a lock (single producer,
+        # single consumer). Only the PortAudio callback writes samples and
+        # advances _write_idx, which it publishes after the copy. Only the
+        # drain thread advances _read_idx.
+        self._ring: Optional[np.ndarray] = None
+        self._write_idx = 0
+        self._read_idx = 0
+        self._max_frames = 0
+        self._overflowed = False
+        # PortAudio status flags OR-ed together since the drain thread last
+        # logged them, so an overflow is not hidden by a later status
+        self._pending_status = sd.CallbackFlags()
         self._recording = False
         self._start_time: Optional[float] = None
         self._on_frames = on_frames
+        # Listener dispatch runs on a drain thread, off the PortAudio callback
+        self._frames_ready = threading.Event()
+        self._drain_thread: Optional[threading.Thread] = None
 
     @property
     def sample_rate(self) -> int:
@@ -101,7 +141,7 @@ class AudioRecorder:
             # if none, prefer degraded mode
             has_inputs = False
             try:
-                devs = sd.query_devices()
+                devs = _cached_query_devices()
                 for d in devs:
                     try:
                         if d.get("max_input_channels", 0) > 0:
@@ -113,13 +153,7 @@ class AudioRecorder:
                 has_inputs = False
 
             # Check if running under pytest
-            in_pytest = False
-            try:
-                import sys
-
-                in_pytest = "pytest" in sys.modules
-            except Exception:
-                pass
+            in_pytest = "pytest" in sys.modules
 
             # Raise in these scenarios:
             # 1. Mock environment (tests)
@@ -136,17 +170,16 @@ class AudioRecorder:
                 raise
 
             # Otherwise, operate in degraded mode without an active stream
-            with self._lock:
-                self._buffer.clear()
-                self._recording = True
-                self._start_time = time.monotonic()
+            self._reset_ring()
+            self._recording = True
+            self._start_time = time.monotonic()
             LOGGER.warning("No input device available; starting in degraded mode")
             return
 
-        with self._lock:
-            self._buffer.clear()
-            self._recording = True
-            self._start_time = time.monotonic()
+        # No stream exists yet, so the callback cannot race the reset
+        self._reset_ring()
+        self._recording = True
+        self._start_time = time.monotonic()
 
         try:
             self._stream = sd.InputStream(
@@ -158,6 +191,7 @@ class AudioRecorder:
                 latency="low",
             )
             self._stream.start()
+            self._start_drain_thread()
             LOGGER.debug(
                 "Started audio capture: %d Hz, %d channel(s)",
                 self._sample_rate,
@@ -190,13 +224,27 @@ class AudioRecorder:
             finally:
                 self._stream = None
 
-        with self._lock:
-            result: np.ndarray
-            if not self._buffer:
-                result = np.array([], dtype=self._dtype).reshape(0, self._channels)
-            else:
-                result = np.concatenate(self._buffer, axis=0)
-            self._buffer.clear()
+        # The stream is closed, so the callback no longer touches the buffer
+        result: np.ndarray
+        written = self._write_idx
+        ring = self._ring
+        if ring is None or written == 0:
+            result = np.array([], dtype=self._dtype).reshape(0, self._channels)
+        else:
+            # Hand the filled region to the caller without copying; the next
+            # start() allocates a fresh buffer so this view is never reused
+            result = ring[:written]
+        self._ring = None
+        self._write_idx = 0
+        self._read_idx = 0
+        self._stop_drain_thread()
+        self._flush_status()
+
+        if self._overflowed:
+            LOGGER.warning(
+                "Recording reached the %d s limit; later audio was dropped",
+                MAX_RECORDING_SECONDS,
+            )
 
         if self._start_time is not None:
             elapsed = time.monotonic() - self._start_time
@@ -217,11 +265,7 @@ class AudioRecorder:
         Returns:
             float: Duration in seconds of captured audio.
         """
-        with self._lock:
-            if not self._buffer:
-                return 0.0
-            total_samples = sum(chunk.shape[0] for chunk in self._buffer)
-            return total_samples / self._sample_rate
+        return self._write_idx / self._sample_rate
 
     def _audio_callback(
         self,
@@ -233,25 +277,98 @@ class AudioRecorder:
         """
         Callback invoked by sounddevice for each audio block.
 
-        This runs in a separate thread managed by PortAudio.
+        This runs in a separate thread managed by PortAudio, so it only copies
+        samples and records state; logging happens on the drain thread.
         """
         if status:
-            LOGGER.warning("Audio callback status: %s", status)
+            # Coalesced: a burst of xruns is reported once per drain pass
+            self._pending_status |= status
 
         if not self._recording:
             return
 
-        with self._lock:
-            # Copy to prevent data corruption when sounddevice reuses buffers
-            chunk = indata.copy()
-            self._buffer.append(chunk)
-        # Notify listener outside the lock to avoid blocking the capture path
-        if self._on_frames is not None:
+        ring = self._ring
+        if ring is None:
+            return
+        start = self._write_idx
+        end = start + indata.shape[0]
+        if end > self._max_frames:
+            # At the recording cap: keep what fits and drop the rest
+            self._overflowed = True
+            end = self._max_frames
+            indata = indata[: end - start]
+            if end <= start:
+                return
+        # Copy into owned memory since sounddevice reuses its buffers, then
+        # publish the new write index
+        ring[start:end] = indata
+        self._write_idx = end
+        # Listener work (e.g. VAD) happens on the drain thread, not here
+        self._frames_ready.set()
+
+    def _start_drain_thread(self) -> None:
+        """Start the thread that hands newly captured frames to ``on_frames``."""
+        self._frames_ready.clear()
+        self._drain_thread = threading.Thread(
+            target=self._drain_frames, name="audio-drain", daemon=True
+        )
+        self._drain_thread.start()
+
+    def _stop_drain_thread(self) -> None:
+        """Wake the drain thread so it exits, and wait for it when safe."""
+        thread = self._drain_thread
+        self._drain_thread = None
+        if thread is None:
+            return
+        self._frames_ready.set()
+        # A listener may stop the recorder from the drain thread itself
+        if thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _drain_frames(self) -> None:
+        """Deliver captured frames to the listener until the recording stops."""
+        while True:
+            self._frames_ready.wait()
+            self._frames_ready.clear()
+            self._flush_status()
+            end = self._write_idx
+            ring = self._ring
+            if ring is None:
+                return
+            start = self._read_idx
+            self._read_idx = end
+            callback = self._on_frames
+            if callback is None or end <= start:
+                continue
             try:
-                self._on_frames(chunk)
+                callback(ring[start:end])
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.debug("on_frames callback error: %s", exc, exc_info=True)
 
+    def _flush_status(self) -> None:
+        """Log any PortAudio status flags reported since the last flush."""
+        status = self._pending_status
+        if not status:
+            return
+        # Swap in fresh flags; if the callback was mid-update it stores the
+        # old object back, so its flags are logged on the next flush instead
+        self._pending_status = sd.CallbackFlags()
+        LOGGER.warning("Audio callback status: %s", status)
+
+    def _reset_ring(self) -> None:
+        """Allocate an empty capture buffer for a new recording.
+
+        The buffer is sized for the recording cap up front so the PortAudio
+        callback never allocates or copies. np.empty only reserves address
+        space; pages are backed as samples are written, so short dictations
+        cost little memory.
+        """
+        self._max_frames = max(int(self._sample_rate * MAX_RECORDING_SECONDS), 1)
+        self._ring = np.empty((self._max_frames, self._channels), dtype=self._dtype)
+        self._write_idx = 0
+        self._read_idx = 0
+        self._overflowed = False
+
     def _verify_device_available(self) -> None:
         """
         Check that an input device is available.
@@ -260,7 +377,7 @@ class AudioRecorder:
             AudioDeviceError: If no input device is found or default is invalid.
         """
         try:
-            devices = sd.query_devices()
+            devices = _cached_query_devices()
             default_pair = sd.default.device
             # Extract input/output indices from various possible representations
             default_input = None
@@ -343,6 +460,8 @@ class AudioRecorder:
             )
 
         except Exception as exc:
+            # Devices may have changed; re-enumerate on the next attempt
+            invalidate_device_cache()
             raise AudioDeviceError(f"Audio device check failed: {exc}") from exc
 
     # --- Optional chunk listener wiring ---------------------------------
@@ -351,7 +470,8 @@ class AudioRecorder:
         """Set or clear a callback invoked with each captured audio chunk.
 
         The callback receives a numpy array shaped (frames, channels) with
-        dtype float32.
+        dtype float32. It is invoked from a dedicated drain thread rather than
+        the PortAudio callback, and may receive several blocks at once.
         """
         self._on_frames = callback
 
@@ -364,7 +484,7 @@ def list_audio_devices() -> list[dict]:
         List of device info dictionaries with keys: name, index, channels.
     """
     try:
-        devices = sd.query_devices()
+        devices = _cached_query_devices()
         return [
             {
                 "name": dev["name"],
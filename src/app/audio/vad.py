@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import logging
 import warnings
-from typing import Any
+from typing import Any, Optional
 
 import numpy as np
 
 LOGGER = logging.getLogger(__name__)
 
+# Frames whose peak stays below this (about 3 PCM16 steps) are treated as
+# silence without calling WebRTC VAD
+SILENCE_PEAK = 1e-4
+
 
 def _import_webrtcvad() -> Any:
     # Suppress deprecation warning emitted by webrtcvad importing pkg_resources
@@ -63,13 +67,19 @@ class VoiceActivityDetector:
         self._trailing_silence_ms = trailing_silence_ms
 
         self._frame_size = (sample_rate * frame_duration_ms) // 1000
+        # Per-frame conversion scratch shared by process_frame and
+        # process_buffer; the int16 view aliases a bytearray that is handed to
+        # WebRTC VAD as-is
+        self._scratch_f32 = np.empty(self._frame_size, dtype=np.float32)
+        self._pcm_bytes = bytearray(self._frame_size * 2)
+        self._scratch_i16 = np.frombuffer(self._pcm_bytes, dtype=np.int16)
 
         webrtcvad = _import_webrtcvad()
         self._vad = webrtcvad.Vad(aggressiveness)
 
-        self._silence_frames = 0
         self._silence_threshold = trailing_silence_ms // frame_duration_ms
-        self._has_speech = False
+        # Silent frames left before auto-stop; -1 until speech has been heard
+        self._silence_countdown = -1
 
         LOGGER.debug(
             "VAD initialized: %d Hz, %d ms frames, aggressiveness=%d, "
@@ -93,8 +103,7 @@ class VoiceActivityDetector:
 
     def reset(self) -> None:
         """Reset VAD state for a new recording session."""
-        self._silence_frames = 0
-        self._has_speech = False
+        self._silence_countdown = -1
         LOGGER.debug("VAD state reset")
 
     def process_frame(self, frame: np.ndarray) -> tuple[bool, bool]:
@@ -111,32 +120,30 @@ class VoiceActivityDetector:
                 - should_stop: True if trailing silence threshold exceeded
         """
         if frame.ndim == 2:
-            frame = frame.flatten()
+            # View for contiguous (n, 1) input; NumPy copies only if it must
+            frame = frame.reshape(-1)
 
         if len(frame) != self._frame_size:
             raise ValueError(
                 f"Frame size mismatch: expected {self._frame_size}, got {len(frame)}"
             )
 
-        # Convert float32 to int16 PCM for WebRTC VAD
-        pcm16 = self._float32_to_pcm16(frame)
-
-        # Detect voice activity
-        is_speech = self._vad.is_speech(pcm16.tobytes(), self._sample_rate)
-
-        # Update speech detection state
-        if is_speech:
-            self._has_speech = True
-            self._silence_frames = 0
+        # Near-digital silence cannot be speech; skip conversion and the C call.
+        # max/min reduce in place, unlike np.abs(frame).max()
+        if frame.max() < SILENCE_PEAK and frame.min() > -SILENCE_PEAK:
+            is_speech = False
         else:
-            self._silence_frames += 1
+            # Convert float32 to int16 PCM for WebRTC VAD
+            self._float32_to_pcm16(frame, self._scratch_f32, self._scratch_i16)
+            is_speech = self._vad.is_speech(self._pcm_bytes, self._sample_rate)
 
-        # Should stop if we've seen speech and now have trailing silence
-        should_stop = (
-            self._has_speech and self._silence_frames >= self._silence_threshold
-        )
+        # Speech rearms the countdown; trailing silence runs it down to zero
+        if is_speech:
+            self._silence_countdown = self._silence_threshold
+        elif self._silence_countdown > 0:
+            self._silence_countdown -= 1
 
-        return is_speech, should_stop
+        return is_speech, self._silence_countdown == 0
 
     def process_buffer(self, buffer: np.ndarray, min_speech_frames: int = 3) -> bool:
         """
@@ -150,25 +157,29 @@ class VoiceActivityDetector:
             True if buffer contains sufficient speech
         """
         if buffer.ndim == 2:
-            buffer = buffer.flatten()
+            buffer = buffer.reshape(-1)
 
-        # Process buffer in frames
-        speech_count = 0
-        total_frames = 0
-
-        for i in range(0, len(buffer), self._frame_size):
-            frame = buffer[i : i + self._frame_size]
-
-            # Skip incomplete frames at the end
-            if len(frame) < self._frame_size:
-                break
-
-            pcm16 = self._float32_to_pcm16(frame)
-            is_speech = self._vad.is_speech(pcm16.tobytes(), self._sample_rate)
+        # Whole frames only; an incomplete tail frame is skipped
+        total_frames = len(buffer) // self._frame_size
+        frames = buffer[: total_frames * self._frame_size].reshape(
+            total_frames, self._frame_size
+        )
 
-            if is_speech:
-                speech_count += 1
-            total_frames += 1
+        # Only frames above the silence floor reach WebRTC VAD, as in
+        # process_frame
+        peaks = np.abs(frames).max(axis=1)
+        voiced = np.flatnonzero(peaks >= SILENCE_PEAK)
+
+        # Each voiced frame is converted into the same scratch buffers that
+        # process_frame uses and handed to the C entry point bound once
+        is_speech = self._vad.is_speech
+        to_pcm16 = self._float32_to_pcm16
+        scaled, pcm16, pcm_bytes = self._scratch_f32, self._scratch_i16, self._pcm_bytes
+        sample_rate = self._sample_rate
+        speech_count = 0
+        for i in voiced.tolist():
+            to_pcm16(frames[i], scaled, pcm16)
+            speech_count += is_speech(pcm_bytes, sample_rate)
 
         has_speech = speech_count >= min_speech_frames
 
@@ -183,19 +194,30 @@ class VoiceActivityDetector:
         return has_speech
 
     @staticmethod
-    def _float32_to_pcm16(audio: np.ndarray) -> np.ndarray:
+    def _float32_to_pcm16(
+        audio: np.ndarray,
+        scaled: Optional[np.ndarray] = None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """
         Convert float32 audio [-1.0, 1.0] to int16 PCM [-32768, 32767].
 
         Args:
             audio: Float32 audio array
+            scaled: Optional float32 scratch, same length as audio
+            out: Optional int16 array, same length as audio, for the result
 
         Returns:
-            Int16 PCM array
+            Int16 PCM array (``out`` when given)
         """
-        # Clip to valid range and scale to int16
-        clipped = np.clip(audio, -1.0, 1.0)
-        return (clipped * 32767.0).astype(np.int16)
+        # Scale, round, then clamp in the int16 domain, all in one float buffer
+        scaled = np.multiply(audio, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32767.0, 32767.0, out=scaled)
+        if out is None:
+            return scaled.astype(np.int16)
+        out[...] = scaled
+        return out
 
 
 def create_vad(
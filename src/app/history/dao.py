@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
+import datetime
+import json
+import logging
+import queue
 import sqlite3
 import threading
 import time
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final, Iterator, Optional
+from typing import Callable, Final, Iterable, Iterator, Optional
 
-from .schema import apply_migrations
+from .schema import FTS_BULK_INSERT_KEY, apply_migrations
+
+LOGGER = logging.getLogger("hoppy_whisper.history")
 
 DEFAULT_RETENTION_DAYS: Final[int] = 90
+SQLITE_MMAP_SIZE: Final[int] = 256 * 1024 * 1024
+SQLITE_CACHE_KIB: Final[int] = 64 * 1024
+# Batches at least this large are indexed with one INSERT ... SELECT into the
+# FTS table instead of firing the insert trigger once per row
+BULK_FTS_MIN_ROWS: Final[int] = 32
+# SQLite VM steps between checks of a search's cancel callback
+SEARCH_PROGRESS_STEPS: Final[int] = 1000
+# Write buffer for export files, so large exports make few write syscalls
+EXPORT_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+INSERT_UTTERANCE_SQL: Final[str] = """
+INSERT INTO utterances (text, created_utc, duration_ms, mode, raw_text)
+VALUES (?, ?, ?, ?, ?)
+"""
 
 
 @dataclass
 class Utterance:
-    """Represents a stored transcription utterance."""
+    """Represents a stored transcription utterance.
+
+    Field order matches the column order of the DAO's SELECT statements, so
+    rows are built positionally with ``Utterance(*row)``.
+    """
 
     id: int
     text: str
@@ -26,8 +51,39 @@ class Utterance:
     raw_text: Optional[str]
 
 
+def _format_fts_query(query: str) -> str:
+    """Turn free text into an FTS5 query of quoted prefix terms.
+
+    Each word becomes ``"word"*`` with embedded quotes doubled. Escaping the
+    whole string first and joining on the quote boundaries keeps this to a
+    few C-level string calls instead of a per-word loop.
+    """
+    words = query.replace('"', '""').split()
+    if not words:
+        return ""
+    if len(words) == 1:
+        return f'"{words[0]}"*'
+    return '"' + '"* "'.join(words) + '"*'
+
+
+def _tune_connection(conn: sqlite3.Connection) -> None:
+    """Apply per-connection read tuning.
+
+    Serve reads from memory-mapped pages and a larger page cache so palette
+    searches avoid a syscall and copy per page.
+    """
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_KIB}")
+
+
 class HistoryDAO:
-    """Database access layer for transcription history."""
+    """Database access layer for transcription history.
+
+    Writes go through one connection serialized by an RLock. Reads borrow a
+    connection from a small pool instead, so under WAL a long export or a
+    palette search never waits behind another thread's query.
+    """
 
     def __init__(
         self, db_path: Path, retention_days: int = DEFAULT_RETENTION_DAYS
@@ -36,6 +92,19 @@ class HistoryDAO:
         self._retention_days = retention_days
         self._conn: Optional[sqlite3.Connection] = None
         self._lock = threading.RLock()
+        # An in-memory database exists only on the writer connection
+        self._pool_reads = str(db_path) != ":memory:"
+        # Idle read-only connections; grows to the peak number of concurrent
+        # readers (palette search worker, exports, the app thread)
+        self._idle_readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        # Row count kept in step with this DAO's writes; None until first counted
+        self._count: Optional[int] = None
+        # Bumped on every write, through this DAO or another connection, so
+        # readers can drop caches
+        self._generation = 0
+        # Writer's PRAGMA data_version, which moves when another connection
+        # (e.g. the Settings window's DAO) commits to the database
+        self._data_version = 0
 
     def open(self) -> None:
         """Open database connection and apply migrations."""
@@ -44,15 +113,61 @@ class HistoryDAO:
                 return
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
             self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
+            # WAL lets commits append to the log instead of rewriting pages, and
+            # NORMAL skips the per-commit fsync that WAL does not need for safety
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            _tune_connection(self._conn)
             apply_migrations(self._conn)
+            self._data_version = self._read_data_version(self._conn)
 
     def close(self) -> None:
         """Close database connection."""
         with self._lock:
-            if self._conn:
-                self._conn.close()
-                self._conn = None
+            readers, self._idle_readers = self._idle_readers, queue.SimpleQueue()
+            try:
+                if self._conn:
+                    # Refresh planner statistics for tables this session
+                    # queried; a no-op unless they have drifted enough to matter
+                    self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error as exc:
+                LOGGER.warning("PRAGMA optimize failed on close: %s", exc)
+            finally:
+                if self._conn:
+                    self._conn.close()
+                    self._conn = None
+                self._count = None
+                while not readers.empty():
+                    readers.get_nowait().close()
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read connection for the duration of a query."""
+        if not self._conn:
+            raise RuntimeError("Database not opened")
+        if not self._pool_reads:
+            with self._lock:
+                if not self._conn:
+                    raise RuntimeError("Database not opened")
+                yield self._conn
+            return
+        pool = self._idle_readers
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            _tune_connection(conn)
+            # Readers never write; refuse it rather than risk contending with
+            # the writer connection for the WAL write lock
+            conn.execute("PRAGMA query_only=1")
+        try:
+            yield conn
+        finally:
+            # Connections borrowed before close() are discarded, not pooled
+            if pool is self._idle_readers and self._conn is not None:
+                pool.put(conn)
+            else:
+                conn.close()
 
     def insert(
         self,
@@ -66,80 +181,144 @@ class HistoryDAO:
             if not self._conn:
                 raise RuntimeError("Database not opened")
 
-            created_utc = int(time.time())
+            created_utc = time.time_ns() // 1_000_000_000
             cursor = self._conn.cursor()
             cursor.execute(
-                """
-                INSERT INTO utterances (text, created_utc, duration_ms, mode, raw_text)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                INSERT_UTTERANCE_SQL,
                 (text, created_utc, duration_ms, mode, raw_text),
             )
             self._conn.commit()
             row_id = cursor.lastrowid
             if row_id is None:
                 raise RuntimeError("Failed to insert utterance")
+            if self._count is not None:
+                self._count += 1
+            self._generation += 1
             return row_id
 
-    def search(self, query: str, limit: int = 50) -> list[Utterance]:
-        """Full-text search across utterances."""
+    def insert_many(
+        self,
+        records: Iterable[tuple[str, str, Optional[int], Optional[str]]],
+    ) -> int:
+        """Insert (text, mode, duration_ms, raw_text) records in one transaction.
+
+        Large batches switch off the per-row FTS trigger with a metadata flag
+        row and index the new rows with a single statement, all inside the
+        same transaction, so no schema change is made and readers keep their
+        prepared statements.
+
+        Returns the number of rows inserted.
+        """
         with self._lock:
-            if not self._conn:
+            conn = self._conn
+            if not conn:
                 raise RuntimeError("Database not opened")
 
-            # Format query for FTS5: add prefix matching and escape special chars
-            # Split into words and add * for prefix matching
-            words = query.strip().split()
-            if not words:
-                return []
-
-            # Escape FTS5 special characters and add prefix wildcard
-            fts_terms = []
-            for word in words:
-                # Escape quotes by doubling them
-                escaped = word.replace('"', '""')
-                # Wrap in quotes for exact token and add * for prefix match
-                fts_terms.append(f'"{escaped}"*')
+            created_utc = time.time_ns() // 1_000_000_000
+            rows = [
+                (text, created_utc, duration_ms, mode, raw_text)
+                for text, mode, duration_ms, raw_text in records
+            ]
+            with conn:
+                if len(rows) < BULK_FTS_MIN_ROWS:
+                    cursor = conn.executemany(INSERT_UTTERANCE_SQL, rows)
+                else:
+                    # Explicit BEGIN so the id read and the flag row share the
+                    # rows' transaction
+                    if not conn.in_transaction:
+                        conn.execute("BEGIN")
+                    # AUTOINCREMENT ids only grow, so new rows are all above this
+                    (last_id,) = conn.execute(
+                        "SELECT COALESCE(MAX(id), 0) FROM utterances"
+                    ).fetchone()
+                    conn.execute(
+                        "INSERT INTO metadata (key, value) VALUES (?, '1')",
+                        (FTS_BULK_INSERT_KEY,),
+                    )
+                    cursor = conn.executemany(INSERT_UTTERANCE_SQL, rows)
+                    conn.execute(
+                        "INSERT INTO utterances_fts(rowid, text) "
+                        "SELECT id, text FROM utterances WHERE id > ?",
+                        (last_id,),
+                    )
+                    conn.execute(
+                        "DELETE FROM metadata WHERE key = ?", (FTS_BULK_INSERT_KEY,)
+                    )
+            if self._count is not None:
+                self._count += cursor.rowcount
+            self._generation += 1
+            return cursor.rowcount
 
-            fts_query = " ".join(fts_terms)
+    def search(
+        self,
+        query: str,
+        limit: int = 50,
+        cancel: Optional[Callable[[], bool]] = None,
+    ) -> list[Utterance]:
+        """Full-text search across utterances.
+
+        ``cancel`` is polled while SQLite runs the query; once it returns True
+        the query is interrupted and an empty list is returned.
+        """
+        with self._reading() as conn:
+            fts_query = _format_fts_query(query)
+            if not fts_query:
+                return []
 
-            cursor = self._conn.cursor()
-            try:
-                cursor.execute(
-                    """
-                    SELECT u.id, u.text, u.created_utc, u.duration_ms,
-                           u.mode, u.raw_text
-                    FROM utterances_fts fts
-                    JOIN utterances u ON fts.rowid = u.id
-                    WHERE utterances_fts MATCH ?
-                    ORDER BY u.created_utc DESC
-                    LIMIT ?
-                    """,
-                    (fts_query, limit),
+            if cancel is not None:
+                conn.set_progress_handler(
+                    lambda: 1 if cancel() else 0, SEARCH_PROGRESS_STEPS
                 )
-                return [self._row_to_utterance(row) for row in cursor.fetchall()]
+            try:
+                return self._search_on(conn, query, fts_query, limit)
             except sqlite3.OperationalError:
-                # Fallback to LIKE search if FTS query fails
-                like_pattern = f"%{query}%"
-                cursor.execute(
-                    """
-                    SELECT id, text, created_utc, duration_ms, mode, raw_text
-                    FROM utterances
-                    WHERE text LIKE ?
-                    ORDER BY created_utc DESC
-                    LIMIT ?
-                    """,
-                    (like_pattern, limit),
-                )
-                return [self._row_to_utterance(row) for row in cursor.fetchall()]
+                if cancel is not None and cancel():
+                    return []
+                raise
+            finally:
+                if cancel is not None:
+                    conn.set_progress_handler(None, 0)
+
+    @staticmethod
+    def _search_on(
+        conn: sqlite3.Connection, query: str, fts_query: str, limit: int
+    ) -> list[Utterance]:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT u.id, u.text, u.created_utc, u.duration_ms,
+                       u.mode, u.raw_text
+                FROM utterances_fts fts
+                JOIN utterances u ON fts.rowid = u.id
+                WHERE utterances_fts MATCH ?
+                ORDER BY u.created_utc DESC
+                LIMIT ?
+                """,
+                (fts_query, limit),
+            )
+            return [Utterance(*row) for row in cursor.fetchall()]
+        except sqlite3.OperationalError as exc:
+            if str(exc) == "interrupted":
+                raise
+            # Fallback to LIKE search if FTS query fails
+            like_pattern = f"%{query}%"
+            cursor.execute(
+                """
+                SELECT id, text, created_utc, duration_ms, mode, raw_text
+                FROM utterances
+                WHERE text LIKE ?
+                ORDER BY created_utc DESC
+                LIMIT ?
+                """,
+                (like_pattern, limit),
+            )
+            return [Utterance(*row) for row in cursor.fetchall()]
 
     def get_recent(self, limit: int = 50) -> list[Utterance]:
         """Get the most recent utterances."""
-        with self._lock:
-            if not self._conn:
-                raise RuntimeError("Database not opened")
-
-            cursor = self._conn.cursor()
+        with self._reading() as conn:
+            cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT id, text, created_utc, duration_ms, mode, raw_text
@@ -149,15 +328,12 @@ class HistoryDAO:
                 """,
                 (limit,),
             )
-            return [self._row_to_utterance(row) for row in cursor.fetchall()]
+            return [Utterance(*row) for row in cursor.fetchall()]
 
     def get_by_id(self, utterance_id: int) -> Optional[Utterance]:
         """Get a specific utterance by ID."""
-        with self._lock:
-            if not self._conn:
-                raise RuntimeError("Database not opened")
-
-            cursor = self._conn.cursor()
+        with self._reading() as conn:
+            cursor = conn.cursor()
             cursor.execute(
                 """
                 SELECT id, text, created_utc, duration_ms, mode, raw_text
@@ -167,7 +343,7 @@ class HistoryDAO:
                 (utterance_id,),
             )
             row = cursor.fetchone()
-            return self._row_to_utterance(row) if row else None
+            return Utterance(*row) if row else None
 
     def delete_older_than(self, days: int) -> int:
         """Delete utterances older than the specified number of days."""
@@ -175,10 +351,13 @@ class HistoryDAO:
             if not self._conn:
                 raise RuntimeError("Database not opened")
 
-            cutoff = int(time.time()) - (days * 86400)
+            cutoff = time.time_ns() // 1_000_000_000 - (days * 86400)
             cursor = self._conn.cursor()
             cursor.execute("DELETE FROM utterances WHERE created_utc < ?", (cutoff,))
             self._conn.commit()
+            if self._count is not None:
+                self._count -= cursor.rowcount
+            self._generation += 1
             return cursor.rowcount
 
     def clear_all(self) -> int:
@@ -190,61 +369,128 @@ class HistoryDAO:
             cursor = self._conn.cursor()
             cursor.execute("DELETE FROM utterances")
             self._conn.commit()
+            self._count = 0
+            self._generation += 1
             return cursor.rowcount
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever utterances are written or deleted."""
+        with self._lock:
+            if self._conn:
+                self._check_external_writes()
+            return self._generation
+
+    @property
+    def last_generation(self) -> int:
+        """Generation as last observed, without taking the lock or querying.
+
+        Safe to poll from a UI thread. Writes through this DAO show up at
+        once; writes from other connections only after ``generation`` or
+        ``count()`` has run since.
+        """
+        return self._generation
+
+    @staticmethod
+    def _read_data_version(conn: sqlite3.Connection) -> int:
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _check_external_writes(self) -> None:
+        """Invalidate cached state if another connection changed the database.
+
+        Called with the lock held and the writer open.
+        """
+        data_version = self._read_data_version(self._conn)
+        if data_version != self._data_version:
+            self._data_version = data_version
+            self._count = None
+            self._generation += 1
+
     def count(self) -> int:
-        """Return the total number of utterances."""
+        """Return the total number of utterances.
+
+        The table is counted once per connection; later writes through this
+        DAO keep the cached value current, and writes from other connections
+        trigger a recount.
+        """
         with self._lock:
             if not self._conn:
                 raise RuntimeError("Database not opened")
 
-            cursor = self._conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM utterances")
-            row = cursor.fetchone()
-            return row[0] if row else 0
+            self._check_external_writes()
+            if self._count is None:
+                cursor = self._conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM utterances")
+                row = cursor.fetchone()
+                self._count = row[0] if row else 0
+            return self._count
 
     def apply_retention_policy(self) -> int:
         """Delete utterances older than retention period."""
         return self.delete_older_than(self._retention_days)
 
     def iter_utterances(self, batch_size: int = 1000) -> Iterator[dict[str, object]]:
-        """Stream utterances in batches using LIMIT/OFFSET pagination.
+        """Stream utterances newest first in batches using keyset pagination.
+
+        Each batch seeks past the last (created_utc, id) seen instead of using
+        OFFSET, so SQLite never rescans rows it has already returned. Ties on
+        created_utc are broken by ascending id, which matches the implicit
+        rowid order of idx_utterances_created and so needs no sort.
 
         Yields dicts: id, text, created_utc, duration_ms, mode, raw_text.
-        Uses RLock to ensure safe concurrent access.
+        Each batch borrows a pooled read connection, so exports do not block
+        writers or other readers.
         """
-        offset = 0
-        while True:
-            with self._lock:
-                if not self._conn:
-                    raise RuntimeError("Database not opened")
+        return self._iter_utterances(self._reading, batch_size)
 
-                cursor = self._conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT id, text, created_utc, duration_ms, mode, raw_text
-                    FROM utterances
-                    ORDER BY created_utc DESC
-                    LIMIT ? OFFSET ?
-                    """,
-                    (batch_size, offset),
-                )
+    def _iter_utterances(
+        self,
+        borrow: Callable[[], AbstractContextManager[sqlite3.Connection]],
+        batch_size: int,
+    ) -> Iterator[dict[str, object]]:
+        """Run iter_utterances' batches on connections from ``borrow``."""
+        last_key: Optional[tuple[int, int]] = None
+        while True:
+            with borrow() as conn:
+                cursor = conn.cursor()
+                if last_key is None:
+                    cursor.execute(
+                        """
+                        SELECT id, text, created_utc, duration_ms, mode, raw_text
+                        FROM utterances
+                        ORDER BY created_utc DESC, id ASC
+                        LIMIT ?
+                        """,
+                        (batch_size,),
+                    )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT id, text, created_utc, duration_ms, mode, raw_text
+                        FROM utterances
+                        WHERE created_utc <= ? AND (created_utc < ? OR id > ?)
+                        ORDER BY created_utc DESC, id ASC
+                        LIMIT ?
+                        """,
+                        (last_key[0], last_key[0], last_key[1], batch_size),
+                    )
                 rows = cursor.fetchall()
 
             if not rows:
                 break
 
-            for row in rows:
+            for utt_id, text, created_utc, duration_ms, mode, raw_text in rows:
                 yield {
-                    "id": row["id"],
-                    "text": row["text"],
-                    "created_utc": row["created_utc"],
-                    "duration_ms": row["duration_ms"],
-                    "mode": row["mode"],
-                    "raw_text": row["raw_text"],
+                    "id": utt_id,
+                    "text": text,
+                    "created_utc": created_utc,
+                    "duration_ms": duration_ms,
+                    "mode": mode,
+                    "raw_text": raw_text,
                 }
 
-            offset += batch_size
+            last = rows[-1]
+            last_key = (last[2], last[0])
 
     def export_all_to_dict(self) -> list[dict[str, object]]:
         """Export all utterances as a list of dictionaries.
@@ -253,12 +499,49 @@ class HistoryDAO:
         """
         return list(self.iter_utterances(batch_size=1000))
 
-    def _row_to_utterance(self, row: sqlite3.Row) -> Utterance:
-        return Utterance(
-            id=row["id"],
-            text=row["text"],
-            created_utc=row["created_utc"],
-            duration_ms=row["duration_ms"],
-            mode=row["mode"],
-            raw_text=row["raw_text"],
-        )
+    def export_to_json(self, path: Path | str) -> int:
+        """Stream all utterances to a JSON file and return how many were written.
+
+        The document matches json.dump(..., indent=2) of the exported_at, count
+        and utterances keys, but rows are encoded one at a time as they come
+        from the database, so memory use stays at one batch regardless of
+        history size.
+        """
+        # One encoder for the whole export; json.dumps with keyword arguments
+        # builds a fresh JSONEncoder per call
+        encode = json.JSONEncoder(
+            indent=2, ensure_ascii=False, check_circular=False
+        ).encode
+        written = 0
+        with self._reading() as conn:
+            # Read the count and the rows in one transaction so they agree
+            # even while the app keeps recording
+            own_transaction = not conn.in_transaction
+            if own_transaction:
+                conn.execute("BEGIN")
+            try:
+                (count,) = conn.execute("SELECT COUNT(*) FROM utterances").fetchone()
+                with open(
+                    path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE
+                ) as f:
+                    exported_at = datetime.datetime.now().isoformat()
+                    f.write(
+                        f'{{\n  "exported_at": {json.dumps(exported_at)},\n'
+                        f'  "count": {count},\n  "utterances": ['
+                    )
+                    parts: list[str] = []
+                    rows = self._iter_utterances(lambda: nullcontext(conn), 1000)
+                    for utt in rows:
+                        # Nest the item two levels deep, as json.dump would
+                        item = encode(utt).replace("\n", "\n    ")
+                        parts.append((",\n    " if written else "\n    ") + item)
+                        written += 1
+                        if len(parts) == 1000:
+                            f.write("".join(parts))
+                            parts.clear()
+                    f.write("".join(parts))
+                    f.write("\n  ]\n}" if written else "]\n}")
+            finally:
+                if own_transaction:
+                    conn.commit()
+        return written
@@ -4,20 +4,49 @@ from __future__ import annotations
 
 import ctypes
 import datetime
-import json
 import logging
+import queue
+import re
 import sys
 import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from typing import Callable, Optional
 
 import customtkinter as ctk
 
-from .dao import HistoryDAO, Utterance
+from .dao import EXPORT_BUFFER_SIZE, HistoryDAO, Utterance
 
 LOGGER = logging.getLogger("hoppy_whisper.history")
 
+# Token characters of the FTS5 unicode61 tokenizer: letters and digits
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _fold_tokens(text: str) -> list[str]:
+    """Split text into tokens the way the FTS index sees them.
+
+    Case and diacritics are folded so ASCII query terms match as in FTS.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _TOKEN_RE.findall(stripped.casefold())
+
+
+@dataclass
+class _ResultRow:
+    """Widgets for one result slot, reused across result updates."""
+
+    frame: ctk.CTkFrame
+    button: ctk.CTkButton
+    meta_label: ctk.CTkLabel
+    visible: bool = False
+    shown: Optional[Utterance] = None
+
 
 def _get_icon_path() -> Optional[Path]:
     """Get the path to the application icon."""
@@ -90,6 +119,9 @@ class HistoryPalette:
     """Type-ahead search palette for transcription history with modern UI."""
 
     ACCENT_COLOR = "#3b82f6"
+    SEARCH_CACHE_SIZE = 32
+    SEARCH_LIMIT = 50
+    RESULT_BATCH = 10
 
     def __init__(
         self,
@@ -105,13 +137,31 @@ class HistoryPalette:
         self._search_entry: Optional[ctk.CTkEntry] = None
         self._results_frame: Optional[ctk.CTkScrollableFrame] = None
         self._status_label: Optional[ctk.CTkLabel] = None
+        self._status_message: Optional[str] = None
         self._current_results: list[Utterance] = []
         self._selected_index: int = 0
         self._result_buttons: list[ctk.CTkButton] = []
-        # Background search state
+        self._result_rows: list[_ResultRow] = []
+        self._highlighted_button: Optional[ctk.CTkButton] = None
+        self._select_after_id: Optional[str] = None
+        # Rows past the first batch are filled by _pump_results from here
+        self._fill_index = 0
+        self._pump_after_id: Optional[str] = None
+        self._empty_label: Optional[ctk.CTkLabel] = None
+        # Fonts shared by all result rows; created with the window
+        self._row_font: Optional[ctk.CTkFont] = None
+        self._meta_font: Optional[ctk.CTkFont] = None
+        # Background search state: one worker serves the latest queued query
         self._search_thread: Optional[threading.Thread] = None
-        self._search_cancelled = False
+        self._search_queue: queue.SimpleQueue[Optional[str]] = queue.SimpleQueue()
         self._search_debounce_id: Optional[str] = None
+        self._last_query = ""
+        # Recent query -> results, so backspacing over a prefix skips SQLite
+        self._search_cache: OrderedDict[str, list[Utterance]] = OrderedDict()
+        # DAO write generation the cached results belong to
+        self._cache_generation: Optional[int] = None
+        # Utterance id -> folded FTS tokens, computed once for narrowing
+        self._folded_tokens: dict[int, list[str]] = {}
 
     def show(self) -> None:
         """Open the history palette window."""
@@ -121,7 +171,11 @@ class HistoryPalette:
             return
 
         self._create_window()
-        self._load_recent()
+        # Paint the window first; recent history arrives from a worker thread
+        self._update_status("Loading history...")
+        threading.Thread(
+            target=self._preload_recent, name="history-preload", daemon=True
+        ).start()
         if self._root:
             self._root.mainloop()
 
@@ -137,8 +191,20 @@ class HistoryPalette:
         ctk.set_widget_scaling(1.0)
         ctk.set_window_scaling(1.0)
 
+        self._last_query = ""
+        self._search_cache.clear()
+        self._folded_tokens.clear()
+        self._status_message = None
+        self._result_rows = []
+        self._result_buttons = []
+        self._highlighted_button = None
+        self._select_after_id = None
+        self._pump_after_id = None
+        self._empty_label = None
         self._root = ctk.CTk()
         self._root.title("Hoppy Whisper History")
+        self._row_font = ctk.CTkFont(family="Consolas", size=12)
+        self._meta_font = ctk.CTkFont(size=11)
 
         # Set window icon (use after() to ensure it overrides customtkinter default)
         def _set_icon() -> None:
@@ -284,15 +350,30 @@ class HistoryPalette:
         y = (self._root.winfo_screenheight() // 2) - (height // 2)
         self._root.geometry(f"{width}x{height}+{x}+{y}")
 
-    def _load_recent(self, limit: int = 50) -> None:
-        """Load recent utterances into the results."""
+    def _preload_recent(self, limit: int = 50) -> None:
+        """Fetch recent utterances off the UI thread when the window opens."""
         try:
-            self._current_results = self._dao.get_recent(limit=limit)
-            self._update_results()
-            self._update_status(f"{len(self._current_results)} recent transcriptions")
+            generation = self._dao.generation
+            results = self._dao.get_recent(limit=limit)
         except Exception as exc:
             LOGGER.error("Failed to load recent utterances: %s", exc)
-            self._update_status("Error loading history")
+            self._post_to_ui(lambda: self._update_status("Error loading history"))
+            return
+
+        def _show() -> None:
+            self._check_cache_generation(generation)
+            self._store_search("", results)
+            # A search typed while loading takes precedence
+            if not self._last_query:
+                self._show_recent(results)
+
+        self._post_to_ui(_show)
+
+    def _show_recent(self, results: list[Utterance]) -> None:
+        """Display recent utterances. Called on main thread."""
+        self._current_results = results
+        self._update_results()
+        self._update_status(f"{len(results)} recent transcriptions")
 
     def _on_search_key(self, event: object = None) -> None:
         """Handle key release in search entry with debouncing."""
@@ -306,32 +387,141 @@ class HistoryPalette:
 
     def _on_search_change(self, *_: object) -> None:
         """Handle search text changes with non-blocking background search."""
+        self._search_debounce_id = None
         if not self._search_entry:
             return
 
         query = self._search_entry.get().strip()
-        self._search_cancelled = True
+        # Navigation keys also fire <KeyRelease>; skip if the text is unchanged
+        if query == self._last_query:
+            return
+        self._last_query = query
+        # An empty query lists recent history, through the same worker and cache
+        self._run_search(query)
+
+    def _run_search(self, query: str) -> None:
+        """Show cached results for ``query`` or queue it for the worker.
+
+        The empty query stands for the recent-history listing.
+        """
+        # The DAO's generation property locks and queries; the UI thread only
+        # compares the last value, and the worker brings fresh ones with results
+        self._check_cache_generation(self._dao.last_generation)
+        cached = self._search_cache.get(query)
+        if cached is not None:
+            self._search_cache.move_to_end(query)
+            self._update_search_results(cached, query)
+            return
 
-        if not query:
-            self._load_recent()
+        narrowed = self._narrow_cached_results(query)
+        if narrowed is not None:
+            self._on_search_done(narrowed, query, self._cache_generation)
             return
 
-        def _background_search() -> None:
-            """Run search in background thread."""
+        self._search_queue.put(query)
+        if self._search_thread is None or not self._search_thread.is_alive():
+            self._search_thread = threading.Thread(
+                target=self._search_worker, name="history-search", daemon=True
+            )
+            self._search_thread.start()
+
+    def _narrow_cached_results(self, query: str) -> Optional[list[Utterance]]:
+        """Filter a cached search for a prefix of ``query`` instead of querying.
+
+        Only complete result sets (fewer than SEARCH_LIMIT rows) are narrowed,
+        and only for plain ASCII word queries, whose FTS prefix matching
+        _fold_tokens reproduces exactly. Returns None when SQLite must be asked.
+        """
+        if not query.isascii():
+            return None
+        terms = query.casefold().split()
+        if not all(_TOKEN_RE.fullmatch(term) for term in terms):
+            return None
+
+        base: Optional[list[Utterance]] = None
+        base_len = -1
+        for cached_query, results in self._search_cache.items():
+            if (
+                len(cached_query) > base_len
+                and cached_query
+                and query.startswith(cached_query)
+                and len(results) < self.SEARCH_LIMIT
+            ):
+                base, base_len = results, len(cached_query)
+        if base is None:
+            return None
+
+        folded = self._folded_tokens
+        narrowed = []
+        for utterance in base:
+            tokens = folded.get(utterance.id)
+            if tokens is None:
+                tokens = folded[utterance.id] = _fold_tokens(utterance.text)
+            if all(any(tok.startswith(term) for tok in tokens) for term in terms):
+                narrowed.append(utterance)
+        return narrowed
+
+    def _search_worker(self) -> None:
+        """Run queued searches, skipping any superseded while one was running."""
+        pending = self._search_queue
+        while True:
+            query = pending.get()
+            while not pending.empty():
+                query = pending.get_nowait()
+            if query is None:
+                return
+
             try:
-                results = self._dao.search(query, limit=50)
+                # Read before querying, so results never look newer than they are
+                generation = self._dao.generation
+                if not query:
+                    results = self._dao.get_recent(limit=self.SEARCH_LIMIT)
+                else:
+                    # Abandon the query as soon as a newer one is waiting
+                    results = self._dao.search(
+                        query,
+                        limit=self.SEARCH_LIMIT,
+                        cancel=lambda: not pending.empty(),
+                    )
+                if not pending.empty():
+                    continue
                 if self._root and self._root.winfo_exists():
                     self._root.after(
-                        0, lambda r=results, q=query: self._update_search_results(r, q)
+                        0, self._on_search_done, results, query, generation
                     )
             except Exception as exc:
                 LOGGER.error("Background search failed: %s", exc)
+                message = "Search error" if query else "Error loading history"
                 if self._root and self._root.winfo_exists():
-                    self._root.after(0, lambda: self._update_status("Search error"))
+                    self._root.after(0, lambda m=message: self._update_status(m))
 
-        self._search_cancelled = False
-        self._search_thread = threading.Thread(target=_background_search, daemon=True)
-        self._search_thread.start()
+    def _check_cache_generation(self, generation: Optional[int]) -> None:
+        """Drop cached searches once the history has been written to.
+
+        The app keeps recording while the palette is open, so new utterances
+        must show up in searches that were cached before they arrived.
+        """
+        if generation != self._cache_generation:
+            self._search_cache.clear()
+            self._cache_generation = generation
+
+    def _on_search_done(
+        self, results: list[Utterance], query: str, generation: Optional[int]
+    ) -> None:
+        """Cache a finished search and show it. Called on main thread.
+
+        ``generation`` is the DAO generation read before the search ran.
+        """
+        self._check_cache_generation(generation)
+        self._store_search(query, results)
+        self._update_search_results(results, query)
+
+    def _store_search(self, query: str, results: list[Utterance]) -> None:
+        """Add results to the LRU search cache, evicting the oldest entry."""
+        self._search_cache[query] = results
+        self._search_cache.move_to_end(query)
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
 
     def _update_search_results(self, results: list[Utterance], query: str) -> None:
         """Update UI with search results. Called on main thread."""
@@ -340,59 +530,98 @@ class HistoryPalette:
         current_query = self._search_entry.get().strip()
         if current_query != query:
             return
-        self._current_results = results
-        self._update_results()
+        # Same rows already on screen: keep them, and the selection, as they are
+        if results != self._current_results:
+            self._current_results = results
+            self._update_results()
         count = len(results)
-        self._update_status(f"{count} result{'s' if count != 1 else ''} found")
+        if not query:
+            self._update_status(f"{count} recent transcriptions")
+        else:
+            self._update_status(f"{count} result{'s' if count != 1 else ''} found")
 
     def _update_results(self) -> None:
         """Update the results display with current results."""
         if not self._results_frame:
             return
 
-        # Clear existing results
-        for widget in self._results_frame.winfo_children():
-            widget.destroy()
-        self._result_buttons.clear()
         self._selected_index = 0
-
-        if not self._current_results:
-            empty_label = ctk.CTkLabel(
-                self._results_frame,
-                text="No transcriptions found",
-                font=ctk.CTkFont(size=14),
-                text_color="gray",
-            )
-            empty_label.pack(pady=40)
+        if self._pump_after_id is not None and self._root:
+            self._root.after_cancel(self._pump_after_id)
+        self._pump_after_id = None
+
+        results = self._current_results
+        rows = self._result_rows
+        # Hidden rows are always a suffix of the pool, so re-packing them in
+        # order keeps the on-screen order
+        for row in rows[len(results) :]:
+            if row.visible:
+                row.frame.pack_forget()
+                row.visible = False
+        self._result_buttons = [row.button for row in rows[: len(results)]]
+
+        if not results:
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    self._results_frame,
+                    text="No transcriptions found",
+                    font=ctk.CTkFont(size=14),
+                    text_color="gray",
+                )
+            self._empty_label.pack(pady=40)
             return
 
-        for i, utterance in enumerate(self._current_results):
-            self._create_result_item(i, utterance)
+        if self._empty_label is not None:
+            self._empty_label.pack_forget()
+
+        self._fill_index = 0
+        self._pump_results()
 
         # Select first item
-        if self._result_buttons:
-            self._select_item(0)
+        self._select_item(0)
+
+    def _pump_results(self) -> None:
+        """Fill the next RESULT_BATCH rows, then yield to the event loop.
+
+        The first screenful appears at once; later rows follow between
+        events so typing and scrolling stay responsive.
+        """
+        self._pump_after_id = None
+        results = self._current_results
+        rows = self._result_rows
+        while True:
+            end = min(self._fill_index + self.RESULT_BATCH, len(results))
+            for index in range(self._fill_index, end):
+                if index == len(rows):
+                    rows.append(self._create_result_row(index))
+                    self._result_buttons.append(rows[index].button)
+                row = rows[index]
+                self._fill_result_row(row, results[index])
+                if not row.visible:
+                    row.frame.pack(fill="x", pady=3, padx=2)
+                    row.visible = True
+            self._fill_index = end
+
+            if end == len(results):
+                return
+            if self._root:
+                self._pump_after_id = self._root.after(1, self._pump_results)
+                return
 
-    def _create_result_item(self, index: int, utterance: Utterance) -> None:
-        """Create a result item widget."""
+    def _create_result_row(self, index: int) -> _ResultRow:
+        """Create the widgets for the result slot at ``index``."""
         # Container frame
         item_frame = ctk.CTkFrame(
             self._results_frame,
             corner_radius=8,
             fg_color=("gray90", "gray17"),
         )
-        item_frame.pack(fill="x", pady=3, padx=2)
         item_frame.grid_columnconfigure(0, weight=1)
 
-        # Text preview (truncated)
-        text = utterance.text[:100]
-        if len(utterance.text) > 100:
-            text += "..."
-
         text_button = ctk.CTkButton(
             item_frame,
-            text=text,
-            font=ctk.CTkFont(family="Consolas", size=12),
+            text="",
+            font=self._row_font,
             fg_color="transparent",
             text_color=("gray10", "gray90"),
             hover_color=("gray80", "gray25"),
@@ -401,7 +630,6 @@ class HistoryPalette:
             command=lambda idx=index: self._on_item_click(idx),
         )
         text_button.pack(fill="x", padx=5, pady=5)
-        self._result_buttons.append(text_button)
 
         # Bind double-click for paste
         text_button.bind(
@@ -409,54 +637,80 @@ class HistoryPalette:
             lambda e, idx=index: self._on_item_double_click(idx),
         )
 
-        # Metadata row
-        meta_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        meta_frame.pack(fill="x", padx=10, pady=(0, 8))
+        # Metadata line: timestamp, duration, mode. One label rather than one
+        # per field, since every CTk widget carries its own canvas
+        meta_label = ctk.CTkLabel(
+            item_frame,
+            text="",
+            font=self._meta_font,
+            text_color="gray",
+            anchor="w",
+        )
+        meta_label.pack(fill="x", padx=10, pady=(0, 8))
 
-        # Timestamp
-        dt = datetime.datetime.fromtimestamp(utterance.created_utc)
-        time_str = dt.strftime("%Y-%m-%d %H:%M")
+        return _ResultRow(frame=item_frame, button=text_button, meta_label=meta_label)
 
-        ctk.CTkLabel(
-            meta_frame,
-            text=time_str,
-            font=ctk.CTkFont(size=11),
-            text_color="gray",
-        ).pack(side="left")
+    def _fill_result_row(self, row: _ResultRow, utterance: Utterance) -> None:
+        """Show ``utterance`` in a pooled result row.
 
-        # Duration
-        if utterance.duration_ms:
-            duration_sec = utterance.duration_ms / 1000
-            ctk.CTkLabel(
-                meta_frame,
-                text=f"• {duration_sec:.1f}s",
-                font=ctk.CTkFont(size=11),
-                text_color="gray",
-            ).pack(side="left", padx=(10, 0))
-
-        # Mode
-        ctk.CTkLabel(
-            meta_frame,
-            text=f"• {utterance.mode}",
-            font=ctk.CTkFont(size=11),
-            text_color="gray",
-        ).pack(side="left", padx=(10, 0))
+        Each CTk ``configure`` redraws the widget's canvas, so only widgets
+        whose content differs from what the row already shows are touched.
+        """
+        prev = row.shown
+        if prev == utterance:
+            return
+        row.shown = utterance
+
+        if prev is None or prev.text != utterance.text:
+            # Text preview (truncated)
+            text = utterance.text[:100]
+            if len(utterance.text) > 100:
+                text += "..."
+            row.button.configure(text=text)
+
+        if (
+            prev is None
+            or prev.created_utc != utterance.created_utc
+            or prev.duration_ms != utterance.duration_ms
+            or prev.mode != utterance.mode
+        ):
+            local = time.localtime(utterance.created_utc)
+            parts = [time.strftime("%Y-%m-%d %H:%M", local)]
+            if utterance.duration_ms:
+                parts.append(f"{utterance.duration_ms / 1000:.1f}s")
+            parts.append(utterance.mode)
+            row.meta_label.configure(text="   •  ".join(parts))
 
     def _select_item(self, index: int) -> None:
-        """Select an item by index."""
+        """Select an item by index.
+
+        The highlight is repainted once the event queue is idle, so a held
+        arrow key redraws only the row it ends on.
+        """
         if not self._result_buttons:
             return
 
-        # Deselect previous
-        if 0 <= self._selected_index < len(self._result_buttons):
-            self._result_buttons[self._selected_index].configure(fg_color="transparent")
-
-        # Select new
         self._selected_index = max(0, min(index, len(self._result_buttons) - 1))
+        if self._root is None:
+            self._apply_selection()
+        elif self._select_after_id is None:
+            self._select_after_id = self._root.after_idle(self._apply_selection)
+
+    def _apply_selection(self) -> None:
+        """Move the highlight to the selected row if it is not already there."""
+        self._select_after_id = None
+        target = None
         if 0 <= self._selected_index < len(self._result_buttons):
-            self._result_buttons[self._selected_index].configure(
-                fg_color=("gray80", "gray25")
-            )
+            target = self._result_buttons[self._selected_index]
+        if target is self._highlighted_button:
+            return
+
+        # Rows are pooled, so the old highlight may be on a row now hidden
+        if self._highlighted_button is not None:
+            self._highlighted_button.configure(fg_color="transparent")
+        if target is not None:
+            target.configure(fg_color=("gray80", "gray25"))
+        self._highlighted_button = target
 
     def _on_item_click(self, index: int) -> None:
         """Handle single click on item - copy to clipboard."""
@@ -478,7 +732,8 @@ class HistoryPalette:
 
     def _update_status(self, message: str) -> None:
         """Update the status label."""
-        if self._status_label:
+        if self._status_label and message != self._status_message:
+            self._status_message = message
             base_msg = "Click to copy • Double-click to paste • Esc to close"
             self._status_label.configure(text=f"{message} • {base_msg}")
 
@@ -521,91 +776,124 @@ class HistoryPalette:
 
     def _on_export_txt(self) -> None:
         """Export history to a text file."""
-        try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"hoppy_whisper_history_{timestamp}.txt"
-
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".txt",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
-                initialfile=default_name,
-            )
-
-            if not file_path:
-                return
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_name = f"hoppy_whisper_history_{timestamp}.txt"
 
-            count = 0
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write("Hoppy Whisper Transcription History\n")
-                f.write("=" * 60 + "\n\n")
-                for utt in self._dao.iter_utterances(batch_size=500):
-                    count += 1
-                    created_utc = utt["created_utc"]
-                    if not isinstance(created_utc, (int, float)):
-                        msg = f"Expected int/float, got {type(created_utc)}"
-                        raise TypeError(msg)
-                    dt = datetime.datetime.fromtimestamp(created_utc)
-                    f.write(f"ID: {utt['id']}\n")
-                    f.write(f"Date: {dt.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write(f"Mode: {utt['mode']}\n")
-                    if utt["duration_ms"]:
-                        f.write(f"Duration: {utt['duration_ms']}ms\n")
-                    f.write(f"Text: {utt['text']}\n")
-                    if utt["raw_text"]:
-                        f.write(f"Raw: {utt['raw_text']}\n")
-                    f.write("\n" + "-" * 60 + "\n\n")
-
-            if count == 0:
-                messagebox.showinfo("Export", "No history to export.")
-                return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".txt",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            initialfile=default_name,
+        )
 
-            messagebox.showinfo(
-                "Export Complete", f"Exported {count} utterances to:\n{file_path}"
-            )
-            LOGGER.info("Exported %d utterances to %s", count, file_path)
+        if not file_path:
+            return
 
-        except Exception as exc:
-            LOGGER.error("Export to TXT failed: %s", exc)
-            messagebox.showerror("Export Failed", f"Failed to export history:\n{exc}")
+        self._start_export(self._write_txt_export, file_path, "TXT")
+
+    def _write_txt_export(self, file_path: str) -> int:
+        """Write all utterances as plain text and return how many were written."""
+        count = 0
+        with open(file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write("Hoppy Whisper Transcription History\n")
+            f.write("=" * 60 + "\n\n")
+            separator = "\n" + "-" * 60 + "\n\n"
+            # One string per utterance, one write per batch
+            parts: list[str] = []
+            for utt in self._dao.iter_utterances(batch_size=500):
+                count += 1
+                created_utc = utt["created_utc"]
+                if not isinstance(created_utc, (int, float)):
+                    msg = f"Expected int/float, got {type(created_utc)}"
+                    raise TypeError(msg)
+                # time.localtime/strftime skip building a datetime per row
+                date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created_utc))
+                duration = (
+                    f"Duration: {utt['duration_ms']}ms\n" if utt["duration_ms"] else ""
+                )
+                raw = f"Raw: {utt['raw_text']}\n" if utt["raw_text"] else ""
+                parts.append(
+                    f"ID: {utt['id']}\n"
+                    f"Date: {date}\n"
+                    f"Mode: {utt['mode']}\n"
+                    f"{duration}"
+                    f"Text: {utt['text']}\n"
+                    f"{raw}{separator}"
+                )
+                if len(parts) == 500:
+                    f.write("".join(parts))
+                    parts.clear()
+            f.write("".join(parts))
+        return count
 
     def _on_export_json(self) -> None:
         """Export history to a JSON file."""
         try:
-            utterances = self._dao.export_all_to_dict()
-            if not utterances:
+            if not self._dao.count():
                 messagebox.showinfo("Export", "No history to export.")
                 return
+        except Exception as exc:
+            LOGGER.error("Export to JSON failed: %s", exc)
+            messagebox.showerror("Export Failed", f"Failed to export history:\n{exc}")
+            return
 
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            default_name = f"hoppy_whisper_history_{timestamp}.json"
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_name = f"hoppy_whisper_history_{timestamp}.json"
 
-            file_path = filedialog.asksaveasfilename(
-                defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
-                initialfile=default_name,
-            )
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialfile=default_name,
+        )
+
+        if not file_path:
+            return
 
-            if not file_path:
+        self._start_export(self._dao.export_to_json, file_path, "JSON")
+
+    def _start_export(
+        self, export: Callable[[str], int], file_path: str, kind: str
+    ) -> None:
+        """Run ``export`` on a worker thread so the palette stays responsive.
+
+        Dialogs are shown back on the Tk thread once the export finishes.
+        """
+        self._update_status(f"Exporting {kind}...")
+
+        def _background_export() -> None:
+            try:
+                count = export(file_path)
+            except Exception as exc:
+                LOGGER.error("Export to %s failed: %s", kind, exc)
+                self._post_to_ui(lambda e=exc: self._on_export_failed(e))
                 return
+            if count:
+                LOGGER.info("Exported %d utterances to %s", count, file_path)
+            self._post_to_ui(lambda: self._on_export_done(count, file_path))
 
-            export_data = {
-                "exported_at": datetime.datetime.now().isoformat(),
-                "count": len(utterances),
-                "utterances": utterances,
-            }
+        threading.Thread(
+            target=_background_export, name="history-export", daemon=True
+        ).start()
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+    def _post_to_ui(self, callback: Callable[[], None]) -> None:
+        """Schedule ``callback`` on the Tk thread if the window is still open."""
+        if self._root and self._root.winfo_exists():
+            self._root.after(0, callback)
 
-            messagebox.showinfo(
-                "Export Complete",
-                f"Exported {len(utterances)} utterances to:\n{file_path}",
-            )
-            LOGGER.info("Exported %d utterances to %s", len(utterances), file_path)
+    def _on_export_done(self, count: int, file_path: str) -> None:
+        """Report a finished export. Called on main thread."""
+        if count == 0:
+            self._update_status("Nothing exported")
+            messagebox.showinfo("Export", "No history to export.")
+            return
+        self._update_status(f"Exported {count} utterances")
+        messagebox.showinfo(
+            "Export Complete", f"Exported {count} utterances to:\n{file_path}"
+        )
 
-        except Exception as exc:
-            LOGGER.error("Export to JSON failed: %s", exc)
-            messagebox.showerror("Export Failed", f"Failed to export history:\n{exc}")
+    def _on_export_failed(self, exc: Exception) -> None:
+        """Report a failed export. Called on main thread."""
+        self._update_status("Export failed")
+        messagebox.showerror("Export Failed", f"Failed to export history:\n{exc}")
 
     def _on_clear_history(self) -> None:
         """Clear all history with confirmation."""
@@ -626,6 +914,8 @@ class HistoryPalette:
 
         try:
             deleted = self._dao.clear_all()
+            self._search_cache.clear()
+            self._folded_tokens.clear()
             self._current_results = []
             self._update_results()
             self._update_status(f"Deleted {deleted} utterances")
@@ -640,6 +930,9 @@ class HistoryPalette:
 
     def _on_close(self) -> None:
         """Close the palette window."""
+        if self._search_thread is not None:
+            self._search_queue.put(None)
+            self._search_thread = None
         if self._root:
             self._root.quit()
             self._root.destroy()
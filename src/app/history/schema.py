@@ -5,7 +5,7 @@ from __future__ import annotations
 import sqlite3
 from typing import Final
 
-SCHEMA_VERSION: Final[int] = 1
+SCHEMA_VERSION: Final[int] = 4
 
 CREATE_UTTERANCES_TABLE: Final[str] = """
 CREATE TABLE IF NOT EXISTS utterances (
@@ -18,28 +18,49 @@ CREATE TABLE IF NOT EXISTS utterances (
 );
 """
 
+# prefix= keeps extra index entries for 2-4 character prefixes, so the
+# palette's per-keystroke "term"* queries avoid scanning every matching term
 CREATE_FTS_TABLE: Final[str] = """
 CREATE VIRTUAL TABLE IF NOT EXISTS utterances_fts USING fts5(
     text,
     content=utterances,
-    content_rowid=id
+    content_rowid=id,
+    prefix='2 3 4'
 );
 """
 
-CREATE_FTS_TRIGGERS: Final[str] = """
-CREATE TRIGGER IF NOT EXISTS utterances_ai AFTER INSERT ON utterances BEGIN
+# metadata key that HistoryDAO.insert_many sets inside its transaction while it
+# indexes a large batch with one statement; the insert trigger skips rows then
+FTS_BULK_INSERT_KEY: Final[str] = "fts_bulk_insert"
+
+# utterances_fts is an external-content table, so removals must go through
+# the FTS5 'delete' command with the old text; a plain DELETE/UPDATE on the
+# index leaves stale tokens behind
+CREATE_FTS_TRIGGERS: Final[str] = f"""
+CREATE TRIGGER IF NOT EXISTS utterances_ai AFTER INSERT ON utterances
+WHEN NOT EXISTS (SELECT 1 FROM metadata WHERE key = '{FTS_BULK_INSERT_KEY}')
+BEGIN
     INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
 END;
 
 CREATE TRIGGER IF NOT EXISTS utterances_ad AFTER DELETE ON utterances BEGIN
-    DELETE FROM utterances_fts WHERE rowid = old.id;
+    INSERT INTO utterances_fts(utterances_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
 END;
 
 CREATE TRIGGER IF NOT EXISTS utterances_au AFTER UPDATE ON utterances BEGIN
-    UPDATE utterances_fts SET text = new.text WHERE rowid = old.id;
+    INSERT INTO utterances_fts(utterances_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+    INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
 END;
 """
 
+DROP_FTS_TRIGGERS: Final[str] = """
+DROP TRIGGER IF EXISTS utterances_ai;
+DROP TRIGGER IF EXISTS utterances_ad;
+DROP TRIGGER IF EXISTS utterances_au;
+"""
+
 CREATE_METADATA_TABLE: Final[str] = """
 CREATE TABLE IF NOT EXISTS metadata (
     key TEXT PRIMARY KEY,
@@ -52,23 +73,56 @@ CREATE INDEX IF NOT EXISTS idx_utterances_created ON utterances(created_utc DESC
 CREATE INDEX IF NOT EXISTS idx_utterances_mode ON utterances(mode);
 """
 
+# Full schema for a new database, run as one script
+SETUP_SCHEMA: Final[str] = (
+    CREATE_UTTERANCES_TABLE + CREATE_FTS_TABLE + CREATE_FTS_TRIGGERS + CREATE_INDICES
+)
+
+# v2 replaced the v1 triggers, which left stale tokens behind; v3 adds prefix
+# indexes. Both recreate the FTS table and rebuild its index, and install the
+# current triggers
+MIGRATE_FTS_TO_V3: Final[str] = (
+    DROP_FTS_TRIGGERS
+    + "DROP TABLE IF EXISTS utterances_fts;"
+    + CREATE_FTS_TABLE
+    + CREATE_FTS_TRIGGERS
+    + "INSERT INTO utterances_fts(utterances_fts) VALUES ('rebuild');"
+)
+
 
 def apply_migrations(conn: sqlite3.Connection) -> None:
-    """Apply database schema and migrations."""
+    """Apply database schema and migrations.
+
+    All pending steps and the version bump run as one script inside a single
+    transaction, so a migration commits (and syncs) once or not at all.
+    """
     cursor = conn.cursor()
 
     cursor.execute(CREATE_METADATA_TABLE)
     cursor.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
     row = cursor.fetchone()
     current_version = int(row[0]) if row else 0
+    if current_version >= SCHEMA_VERSION:
+        return
 
+    steps = []
     if current_version < 1:
-        cursor.execute(CREATE_UTTERANCES_TABLE)
-        cursor.execute(CREATE_FTS_TABLE)
-        cursor.executescript(CREATE_FTS_TRIGGERS)
-        cursor.executescript(CREATE_INDICES)
-        cursor.execute(
-            "INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', ?)",
-            (str(SCHEMA_VERSION),),
-        )
-        conn.commit()
+        steps.append(SETUP_SCHEMA)
+    elif current_version < 3:
+        steps.append(MIGRATE_FTS_TO_V3)
+    elif current_version < 4:
+        # v4 lets insert_many switch off the insert trigger without DDL
+        steps.append(DROP_FTS_TRIGGERS + CREATE_FTS_TRIGGERS)
+    steps.append(
+        "INSERT OR REPLACE INTO metadata (key, value) "
+        f"VALUES ('schema_version', '{SCHEMA_VERSION}');"
+    )
+
+    # executescript commits any pending transaction first, then runs the
+    # script as written
+    try:
+        cursor.executescript("BEGIN IMMEDIATE;" + "".join(steps) + "COMMIT;")
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
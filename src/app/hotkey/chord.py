@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import FrozenSet, Iterable, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Tuple
 
 MODIFIER_FLAGS = {
     "alt": 0x0001,
@@ -26,6 +26,47 @@ MODIFIER_KEYCODES = {
 }
 
 
+_PUNCTUATION_KEYCODES = {
+    ";": 0xBA,
+    "=": 0xBB,
+    ",": 0xBC,
+    "-": 0xBD,
+    ".": 0xBE,
+    "/": 0xBF,
+    "`": 0xC0,
+    "[": 0xDB,
+    "\\": 0xDC,
+    "]": 0xDD,
+    "'": 0xDE,
+}
+
+_NAMED_KEYCODES = {
+    "space": 0x20,
+    "enter": 0x0D,
+    "tab": 0x09,
+    "escape": 0x1B,
+    "esc": 0x1B,
+    "backspace": 0x08,
+    "delete": 0x2E,
+    "home": 0x24,
+    "end": 0x23,
+    "pageup": 0x21,
+    "pagedown": 0x22,
+    "insert": 0x2D,
+    "up": 0x26,
+    "down": 0x28,
+    "left": 0x25,
+    "right": 0x27,
+}
+
+# Lower-case key token -> virtual key group, built once at import
+_TOKEN_TO_VKS: Dict[str, FrozenSet[int]] = {
+    **{token: frozenset({vk}) for token, vk in _PUNCTUATION_KEYCODES.items()},
+    **{token: frozenset({vk}) for token, vk in _NAMED_KEYCODES.items()},
+    **{f"f{idx}": frozenset({0x70 + idx - 1}) for idx in range(1, 25)},
+}
+
+
 class HotkeyParseError(ValueError):
     """Raised when a hotkey chord cannot be parsed."""
 
@@ -38,6 +79,16 @@ class HotkeyChord:
     modifier_mask: int
     modifier_groups: Tuple[FrozenSet[int], ...]
     key_group: FrozenSet[int]
+    # Bitmask forms (bit n set for virtual key n) used by the matching hot path
+    _key_bits: int = field(init=False, repr=False, compare=False)
+    _modifier_bits: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_key_bits", vk_bits(self.key_group))
+        modifier_bits = tuple(vk_bits(group) for group in self.modifier_groups)
+        object.__setattr__(
+            self, "_modifier_bits", tuple(bits for bits in modifier_bits if bits)
+        )
 
     @property
     def display(self) -> str:
@@ -46,17 +97,26 @@ class HotkeyChord:
 
     def matches(self, pressed: Iterable[int]) -> bool:
         """Check whether the supplied virtual key codes satisfy the chord."""
-        pressed_set = frozenset(pressed)
-        if not pressed_set:
-            return False
-        if not self.key_group.intersection(pressed_set):
+        return self.matches_bits(vk_bits(pressed))
+
+    def matches_bits(self, pressed_bits: int) -> bool:
+        """Check a pressed-key bitmask (see ``vk_bits``) against the chord."""
+        if not pressed_bits & self._key_bits:
             return False
-        for group in self.modifier_groups:
-            if group and not group.intersection(pressed_set):
+        for group_bits in self._modifier_bits:
+            if not pressed_bits & group_bits:
                 return False
         return True
 
 
+def vk_bits(codes: Iterable[int]) -> int:
+    """Return a bitmask with bit n set for each virtual key code n."""
+    bits = 0
+    for code in codes:
+        bits |= 1 << code
+    return bits
+
+
 def parse_hotkey(text: str) -> HotkeyChord:
     """Parse a user-supplied hotkey string."""
     if not text:
@@ -91,46 +151,12 @@ def parse_hotkey(text: str) -> HotkeyChord:
 
 
 def _key_to_virtual_keys(token: str) -> FrozenSet[int]:
-    punctuation = {
-        ";": 0xBA,
-        "=": 0xBB,
-        ",": 0xBC,
-        "-": 0xBD,
-        ".": 0xBE,
-        "/": 0xBF,
-        "`": 0xC0,
-        "[": 0xDB,
-        "\\": 0xDC,
-        "]": 0xDD,
-        "'": 0xDE,
-    }
-    if token in punctuation:
-        return frozenset({punctuation[token]})
+    key_group = _TOKEN_TO_VKS.get(token)
+    if key_group is not None:
+        return key_group
     if token.startswith("f") and token[1:].isdigit():
-        idx = int(token[1:])
-        if 1 <= idx <= 24:
-            return frozenset({0x70 + idx - 1})
-    named = {
-        "space": 0x20,
-        "enter": 0x0D,
-        "tab": 0x09,
-        "escape": 0x1B,
-        "esc": 0x1B,
-        "backspace": 0x08,
-        "delete": 0x2E,
-        "home": 0x24,
-        "end": 0x23,
-        "pageup": 0x21,
-        "pagedown": 0x22,
-        "insert": 0x2D,
-        "up": 0x26,
-        "down": 0x28,
-        "left": 0x25,
-        "right": 0x27,
-    }
-    if token in named:
-        return frozenset({named[token]})
+        # Zero-padded spellings such as "f01"; the table holds "f1".."f24"
+        return _TOKEN_TO_VKS.get(f"f{int(token[1:])}", frozenset())
     if len(token) == 1:
-        char = token.upper()
-        return frozenset({ord(char)})
+        return frozenset({ord(token.upper())})
     return frozenset()
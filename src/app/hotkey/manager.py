@@ -8,7 +8,8 @@ import sys
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional, Set
+from functools import partial
+from typing import Callable, Optional
 
 from pynput import keyboard
 
@@ -83,8 +84,85 @@ class _ListenerWrapper:
         self._listener.join(timeout=0.5)
 
 
+# Keeps a held chord from posting repeated WM_HOTKEY messages
+MOD_NOREPEAT = 0x4000
+WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
+PM_NOREMOVE = 0x0000
+
+
+class _WindowsHotkeyLoop:
+    """Deliver RegisterHotKey presses from a dedicated message-loop thread.
+
+    The thread registers the hotkey itself, since WM_HOTKEY is posted to the
+    registering thread's queue, and wakes only when the chord is pressed
+    rather than on every keystroke system-wide.
+    """
+
+    def __init__(
+        self,
+        register: Callable[[], None],
+        unregister: Callable[[], None],
+        on_hotkey: Callable[[], None],
+    ) -> None:
+        self._register = register
+        self._unregister = unregister
+        self._on_hotkey = on_hotkey
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread_id = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the loop, raising any error from registering the hotkey."""
+        self._thread = threading.Thread(
+            target=self._run, name="hotkey-loop", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        self._thread.join(timeout=0.5)
+        self._thread = None
+
+    def _run(self) -> None:
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+        msg = wintypes.MSG()
+        self._thread_id = kernel32.GetCurrentThreadId()
+        # Create this thread's message queue before stop() can post to it
+        user32.PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+        try:
+            self._register()
+        except BaseException as exc:
+            self._error = exc
+            self._ready.set()
+            return
+        self._ready.set()
+        try:
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                if msg.message == WM_HOTKEY:
+                    self._on_hotkey()
+        finally:
+            self._unregister()
+
+
 class HotkeyManager:
-    """Manage global hotkey detection with hold/release semantics."""
+    """Manage global hotkey detection with hold/release semantics.
+
+    On Windows in toggle mode, presses arrive as WM_HOTKEY messages and no
+    keyboard hook is installed; hold mode needs key releases, which only the
+    pynput listener reports.
+    """
 
     def __init__(
         self,
@@ -105,8 +183,9 @@ class HotkeyManager:
         self._callbacks = callbacks
         self._listener_factory = listener_factory or _ListenerWrapper
         self._lock = threading.RLock()
-        self._listener: Optional[_ListenerWrapper] = None
-        self._pressed: Set[int] = set()
+        self._listener: Optional[_ListenerWrapper | _WindowsHotkeyLoop] = None
+        # Currently held virtual keys, bit n set for VK n
+        self._pressed_bits = 0
         self._active = False
         self._chord_down = False
         self._last_release_time = 0.0
@@ -136,7 +215,7 @@ class HotkeyManager:
         with self._lock:
             chord = self._parse_and_validate(chord_text)
             self._chord = chord
-            self._pressed.clear()
+            self._pressed_bits = 0
             self._active = False
 
     def start(self) -> None:
@@ -145,10 +224,21 @@ class HotkeyManager:
             if self._running:
                 return
             self._ensure_hotkey_available(self._chord)
-            # On Windows, register the hotkey for the app lifetime until stop()
-            if sys.platform == "win32":
-                self._register_hotkey()
-            listener = self._listener_factory(self._on_press, self._on_release)
+            listener: _ListenerWrapper | _WindowsHotkeyLoop
+            if sys.platform == "win32" and self._toggle_mode:
+                # The loop thread owns this registration: it registers the chord
+                # and unregisters it on exit, without touching _registered,
+                # which a later start() may already have set again
+                listener = _WindowsHotkeyLoop(
+                    partial(_register_chord, self._chord, self._reg_id),
+                    partial(_unregister_chord, self._reg_id),
+                    self._on_hotkey,
+                )
+            else:
+                # On Windows, register the hotkey for the app lifetime until stop()
+                if sys.platform == "win32":
+                    self._register_hotkey()
+                listener = self._listener_factory(self._on_press, self._on_release)
             listener.start()
             self._listener = listener
             self._running = True
@@ -158,35 +248,30 @@ class HotkeyManager:
         with self._lock:
             if not self._running:
                 return
-            if self._listener:
-                self._listener.stop()
-            self._listener = None
+            listener, self._listener = self._listener, None
             if sys.platform == "win32" and self._registered:
                 self._unregister_hotkey()
             self._running = False
-            self._pressed.clear()
+            self._pressed_bits = 0
             self._active = False
+        # Outside the lock: the listener thread may be waiting for it to deliver
+        # a press, which now finds _running cleared and returns
+        if listener:
+            listener.stop()
 
     def _on_press(self, key: keyboard.Key | keyboard.KeyCode) -> None:
         vk = _vk_from_key(key)
         if vk is None:
             return
         with self._lock:
-            self._pressed.add(vk)
-            if not self._chord.matches(self._pressed):
+            self._pressed_bits |= 1 << vk
+            if not self._chord.matches_bits(self._pressed_bits):
                 return
             if self._toggle_mode:
                 if self._chord_down:
                     return
                 self._chord_down = True
-                if not self._active:
-                    self._active = True
-                    self._dispatch(self._callbacks.on_record_start)
-                else:
-                    # Toggle off on chord press
-                    self._active = False
-                    self._last_release_time = 0.0
-                    self._dispatch(self._callbacks.on_record_stop)
+                self._toggle_recording()
                 return
             # Hold/release mode
             if self._active:
@@ -206,20 +291,38 @@ class HotkeyManager:
         if vk is None:
             return
         with self._lock:
-            self._pressed.discard(vk)
-            if not self._chord.matches(self._pressed):
+            self._pressed_bits &= ~(1 << vk)
+            chord_held = self._chord.matches_bits(self._pressed_bits)
+            if not chord_held:
                 self._chord_down = False
             if self._toggle_mode:
                 # In toggle mode, stopping happens on the next chord press
                 return
             if not self._active:
                 return
-            if self._chord.matches(self._pressed):
+            if chord_held:
                 return
             self._active = False
             self._last_release_time = time.monotonic()
             self._dispatch(self._callbacks.on_record_stop)
 
+    def _on_hotkey(self) -> None:
+        """Handle a WM_HOTKEY press; only used in toggle mode."""
+        with self._lock:
+            if not self._running:
+                return
+            self._toggle_recording()
+
+    def _toggle_recording(self) -> None:
+        if not self._active:
+            self._active = True
+            self._dispatch(self._callbacks.on_record_start)
+        else:
+            # Toggle off on chord press
+            self._active = False
+            self._last_release_time = 0.0
+            self._dispatch(self._callbacks.on_record_stop)
+
     def _parse_and_validate(self, chord_input: str | HotkeyChord) -> HotkeyChord:
         chord = (
             chord_input
@@ -234,27 +337,12 @@ class HotkeyManager:
 
     def _register_hotkey(self) -> None:
         """Register the global hotkey on Windows and keep it until stop()."""
-        virtual_key = next(iter(self._chord.key_group))
-        modifiers = self._chord.modifier_mask
-        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
-        kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
-        kernel32.SetLastError(0)
-        if not user32.RegisterHotKey(None, self._reg_id, modifiers, virtual_key):
-            error_code = ctypes.get_last_error()
-            if error_code == 1409:
-                raise HotkeyInUseError(
-                    f"Hotkey '{self._chord.display}' is already registered"
-                )
-            raise HotkeyRegistrationError(
-                f"Failed to register hotkey '{self._chord.display}' "
-                f"(error {error_code})"
-            )
+        _register_chord(self._chord, self._reg_id)
         self._registered = True
 
     def _unregister_hotkey(self) -> None:
-        user32 = ctypes.windll.user32  # type: ignore[attr-defined]
         try:
-            user32.UnregisterHotKey(None, self._reg_id)
+            _unregister_chord(self._reg_id)
         finally:
             self._registered = False
 
@@ -277,6 +365,27 @@ class HotkeyManager:
                 LOGGER.exception("Error callback also failed", exc_info=err)
 
 
+def _register_chord(chord: HotkeyChord, reg_id: int) -> None:
+    """Register ``chord`` for the calling thread, which must also unregister it."""
+    virtual_key = next(iter(chord.key_group))
+    modifiers = chord.modifier_mask | MOD_NOREPEAT
+    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+    kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+    kernel32.SetLastError(0)
+    if not user32.RegisterHotKey(None, reg_id, modifiers, virtual_key):
+        error_code = ctypes.get_last_error()
+        if error_code == 1409:
+            raise HotkeyInUseError(f"Hotkey '{chord.display}' is already registered")
+        raise HotkeyRegistrationError(
+            f"Failed to register hotkey '{chord.display}' (error {error_code})"
+        )
+
+
+def _unregister_chord(reg_id: int) -> None:
+    user32 = ctypes.windll.user32  # type: ignore[attr-defined]
+    user32.UnregisterHotKey(None, reg_id)
+
+
 def _vk_from_key(key: keyboard.Key | keyboard.KeyCode) -> Optional[int]:
     if isinstance(key, keyboard.KeyCode):
         if key.vk is not None:
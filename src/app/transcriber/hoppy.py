@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -301,6 +303,49 @@ class HoppyTranscriber:
             logger.error(f"Transcription failed: {e}")
             raise RuntimeError(f"Transcription failed: {e}") from e
 
+    def transcribe_audio(
+        self, audio: np.ndarray, sample_rate: int = 16000
+    ) -> TranscriptionResult:
+        """Transcribe an in-memory float32 waveform.
+
+        The waveform is handed to the model directly, skipping the temporary
+        WAV file and the model's WAV parsing.
+
+        Args:
+            audio: Mono float32 samples, shape (samples,) or (samples, 1)
+            sample_rate: Sample rate in Hz (default: 16000)
+
+        Returns:
+            TranscriptionResult with text and timing information
+
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        waveform = np.ascontiguousarray(audio.reshape(-1), dtype=np.float32)
+
+        self._ensure_model_loaded()
+
+        logger.info(f"Transcribing {len(waveform)} in-memory samples...")
+        start_time = time.time()
+
+        try:
+            text = self._model.recognize(waveform, sample_rate=sample_rate)
+            duration_ms = (time.time() - start_time) * 1000
+
+            logger.info(
+                f"Transcription completed in {duration_ms:.0f} ms: '{text[:50]}...'"
+            )
+
+            return TranscriptionResult(
+                text=text,
+                duration_ms=duration_ms,
+                model_name=HOPPY_MODEL_REPO,
+            )
+
+        except Exception as e:
+            logger.error(f"Transcription failed: {e}")
+            raise RuntimeError(f"Transcription failed: {e}") from e
+
     def transcribe_buffer(
         self, audio_data: bytes, sample_rate: int = 16000
     ) -> TranscriptionResult:
@@ -262,8 +262,11 @@ class RemoteTranscriber:
             if self.api_key:
                 headers["Authorization"] = f"Bearer {self.api_key}"
 
+            # Anonymous temp files (/proc/self/fd/N) have no extension; APIs
+            # commonly infer the audio format from the upload name
+            upload_name = audio_path.name if audio_path.suffix else "audio.wav"
             with open(audio_path, "rb") as audio_file:
-                files = {"file": (audio_path.name, audio_file, "audio/wav")}
+                files = {"file": (upload_name, audio_file, "audio/wav")}
                 data = {}
                 if self.model:
                     data["model"] = self.model
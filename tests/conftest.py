@@ -3,6 +3,17 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC = ROOT / "src"
 sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _reset_audio_device_cache():
+    """Keep cached PortAudio enumerations from leaking between tests."""
+    yield
+    recorder = sys.modules.get("app.audio.recorder")
+    if recorder is not None:
+        recorder.invalidate_device_cache()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, Mock
 
 import numpy as np
@@ -67,6 +68,14 @@ def test_list_audio_devices_returns_input_devices(mock_sounddevice):
     assert devices[0]["channels"] == 2
 
 
+def test_list_audio_devices_reuses_recent_enumeration(mock_sounddevice):
+    """Test that repeated device listings share one PortAudio enumeration."""
+    list_audio_devices()
+    list_audio_devices()
+
+    assert mock_sounddevice.query_devices.call_count == 1
+
+
 def test_initialize_audio_pipeline_succeeds_with_devices(mock_sounddevice):
     """Test that initialize_audio_pipeline succeeds when devices are available."""
     initialize_audio_pipeline()
@@ -227,6 +236,69 @@ def test_audio_recorder_callback_copies_data(mock_sounddevice):
     assert buffer[0, 0] == 1.0
 
 
+def test_audio_recorder_callback_never_reallocates(mock_sounddevice):
+    """Test that the capture buffer is allocated once, before the stream runs."""
+    recorder = AudioRecorder()
+    recorder.start()
+    ring = recorder._ring
+
+    callback = mock_sounddevice.InputStream.call_args.kwargs["callback"]
+    for value in range(5):
+        chunk = np.full((512, 1), float(value), dtype=np.float32)
+        callback(chunk, 512, None, MagicMock())
+    assert recorder._ring is ring
+
+    buffer = recorder.stop()
+
+    assert buffer.shape == (2560, 1)
+    assert buffer[0, 0] == 0.0
+    assert buffer[-1, 0] == 4.0
+
+
+def test_audio_recorder_caps_recording_length(
+    mock_sounddevice, monkeypatch: pytest.MonkeyPatch, caplog
+):
+    """Test that audio past MAX_RECORDING_SECONDS is dropped with a warning."""
+    monkeypatch.setattr("app.audio.recorder.MAX_RECORDING_SECONDS", 0.1)
+    recorder = AudioRecorder()
+    recorder.start()
+
+    callback = mock_sounddevice.InputStream.call_args.kwargs["callback"]
+    for _ in range(5):
+        callback(np.ones((512, 1), dtype=np.float32), 512, None, MagicMock())
+
+    with caplog.at_level("WARNING"):
+        buffer = recorder.stop()
+
+    assert buffer.shape == (1600, 1)
+    assert "limit" in caplog.text
+
+
+def test_audio_recorder_delivers_frames_off_callback_thread(mock_sounddevice):
+    """Test that on_frames listeners run on the drain thread, not in the callback."""
+    received: list[np.ndarray] = []
+    threads: list[str] = []
+    delivered = threading.Event()
+
+    def on_frames(chunk: np.ndarray) -> None:
+        received.append(chunk.copy())
+        threads.append(threading.current_thread().name)
+        delivered.set()
+
+    recorder = AudioRecorder(on_frames=on_frames)
+    recorder.start()
+
+    callback = mock_sounddevice.InputStream.call_args.kwargs["callback"]
+    callback(np.full((512, 1), 0.5, dtype=np.float32), 512, None, MagicMock())
+
+    assert delivered.wait(timeout=2.0)
+    recorder.stop()
+
+    assert threads == ["audio-drain"]
+    assert received[0].shape == (512, 1)
+    assert received[0][0, 0] == 0.5
+
+
 def test_audio_recorder_handles_stream_error(mock_sounddevice):
     """Test that recorder handles stream creation errors gracefully."""
     mock_sounddevice.InputStream.side_effect = Exception("Stream error")
@@ -263,6 +335,9 @@ def test_audio_recorder_reports_callback_status_warnings(mock_sounddevice, caplo
     chunk = np.random.rand(512, 1).astype(np.float32)
     callback(chunk, 512, None, status_mock)
 
+    # Status is logged off the real-time thread, at the latest by stop()
+    recorder.stop()
+
     assert "Audio callback status" in caplog.text
 
 
@@ -274,3 +349,40 @@ def test_list_audio_devices_handles_errors_gracefully(monkeypatch: pytest.Monkey
 
     devices = list_audio_devices()
     assert devices == []
+
+
+class _Flags:
+    """Stand-in for sd.CallbackFlags with its in-place OR semantics."""
+
+    def __init__(self, *names: str) -> None:
+        self.names = set(names)
+
+    def __bool__(self) -> bool:
+        return bool(self.names)
+
+    def __ior__(self, other: _Flags) -> _Flags:
+        self.names |= other.names
+        return self
+
+    def __str__(self) -> str:
+        return ", ".join(sorted(self.names))
+
+
+def test_audio_recorder_keeps_overflow_reported_before_other_status(
+    mock_sounddevice, caplog
+):
+    """Test that status flags accumulate until the drain thread logs them."""
+    mock_sounddevice.CallbackFlags = _Flags
+    recorder = AudioRecorder()
+    recorder.start()
+    callback = mock_sounddevice.InputStream.call_args.kwargs["callback"]
+    chunk = np.zeros((512, 1), dtype=np.float32)
+
+    recorder._stop_drain_thread()
+    callback(chunk, 512, None, _Flags("input overflow"))
+    callback(chunk, 512, None, _Flags("input underflow"))
+    with caplog.at_level("WARNING"):
+        recorder.stop()
+
+    assert "input overflow, input underflow" in caplog.text
+    assert not recorder._pending_status
@@ -27,6 +27,15 @@ def test_float32_to_pcm16_conversion():
     assert pcm16[4] == 32767
 
 
+def test_float32_to_pcm16_clips_out_of_range_samples():
+    """Test that samples past full scale clip instead of wrapping around."""
+    audio = np.array([1.05, -1.2, 3.0, -3.0], dtype=np.float32)
+
+    pcm16 = float32_to_pcm16(audio)
+
+    np.testing.assert_array_equal(pcm16, [32767, -32767, 32767, -32767])
+
+
 def test_write_wav_with_float32_audio(tmp_path: Path):
     """Test writing float32 audio to WAV file."""
     output_path = tmp_path / "test_float32.wav"
@@ -84,3 +93,16 @@ def test_audio_buffer_to_pcm16_bytes_with_float32():
     assert pcm16[0] == -32767
     assert pcm16[1] == 0
     assert pcm16[2] == 32767
+
+
+def test_audio_buffer_to_pcm16_bytes_with_int16_is_zero_copy():
+    """Test that contiguous int16 input is exposed without copying."""
+    audio = np.array([-32768, 0, 32767], dtype=np.int16)
+    pcm_bytes = audio_buffer_to_pcm16_bytes(audio)
+
+    assert isinstance(pcm_bytes, memoryview)
+    assert pcm_bytes.nbytes == audio.nbytes
+    assert bytes(pcm_bytes) == audio.tobytes()
+
+    audio[1] = 1234
+    assert np.frombuffer(pcm_bytes, dtype=np.int16)[1] == 1234
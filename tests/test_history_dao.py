@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import sqlite3
+import threading
 import time
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -34,6 +37,14 @@ def test_dao_opens_and_creates_database(temp_db: Path):
     dao.close()
 
 
+def test_dao_tunes_connection_pragmas(dao: HistoryDAO):
+    """Test that open() enables WAL and the read-side cache settings."""
+    conn = dao._conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+
 def test_insert_utterance(dao: HistoryDAO):
     """Test inserting a new utterance."""
     utterance_id = dao.insert(
@@ -58,6 +69,44 @@ def test_insert_without_optional_fields(dao: HistoryDAO):
     assert utterance.raw_text is None
 
 
+def test_insert_many(dao: HistoryDAO):
+    """Test inserting several utterances in one transaction."""
+    inserted = dao.insert_many(
+        [
+            ("First batch row", "standard", 1000, "first batch row"),
+            ("Second batch row", "standard", None, None),
+        ]
+    )
+
+    assert inserted == 2
+    assert dao.count() == 2
+    assert len(dao.search("batch")) == 2
+
+
+def test_insert_many_bulk_indexes_fts(dao: HistoryDAO):
+    """Test that large batches are searchable and keep the insert trigger."""
+    from app.history.dao import BULK_FTS_MIN_ROWS
+
+    dao.insert("Before the batch", "standard")
+    (schema_version,) = dao._conn.execute("PRAGMA schema_version").fetchone()
+    rows = [(f"Bulk row {i}", "standard", None, None) for i in range(BULK_FTS_MIN_ROWS)]
+    assert dao.insert_many(rows) == BULK_FTS_MIN_ROWS
+
+    # No DDL, so pooled readers keep their prepared statements
+    assert dao._conn.execute("PRAGMA schema_version").fetchone() == (schema_version,)
+    assert dao._conn.execute("SELECT key FROM metadata").fetchall() == [
+        ("schema_version",)
+    ]
+
+    assert len(dao.search("bulk", limit=1000)) == BULK_FTS_MIN_ROWS
+    assert len(dao.search("before")) == 1
+    dao._conn.execute(
+        "INSERT INTO utterances_fts(utterances_fts, rank) VALUES ('integrity-check', 1)"
+    )
+    dao.insert("After the batch", "standard")
+    assert len(dao.search("after")) == 1
+
+
 def test_get_by_id(dao: HistoryDAO):
     """Test retrieving utterance by ID."""
     utterance_id = dao.insert(
@@ -139,6 +188,31 @@ def test_fts_search_with_limit(dao: HistoryDAO):
     assert len(results) == 5
 
 
+def test_fts_search_cancel(dao: HistoryDAO):
+    """Test that a search is interrupted once its cancel callback fires."""
+    dao.insert_many([(f"Cancel test {i}", "standard", None, None) for i in range(2000)])
+    polls = []
+
+    def cancel() -> bool:
+        polls.append(True)
+        return True
+
+    assert dao.search("cancel", limit=2000, cancel=cancel) == []
+    assert polls
+    # The progress handler is removed again for the next borrower
+    assert len(dao.search("cancel", limit=2000)) == 2000
+    assert len(dao.search("cancel", limit=10, cancel=lambda: False)) == 10
+
+
+def test_format_fts_query_quotes_prefix_terms():
+    """Test FTS query formatting escapes quotes and adds prefix wildcards."""
+    from app.history.dao import _format_fts_query
+
+    assert _format_fts_query("  ") == ""
+    assert _format_fts_query("hello") == '"hello"*'
+    assert _format_fts_query(' say "hi"  there ') == '"say"* """hi"""* "there"*'
+
+
 def test_count(dao: HistoryDAO):
     """Test counting utterances."""
     assert dao.count() == 0
@@ -151,6 +225,36 @@ def test_count(dao: HistoryDAO):
     assert dao.count() == 3
 
 
+def test_count_tracks_writes_after_first_query(dao: HistoryDAO):
+    """Test that the cached count follows inserts and deletes."""
+    dao.insert("First", "standard")
+    assert dao.count() == 1
+
+    dao.insert_many([("Second", "standard", None, None), ("Third", "raw", None, None)])
+    assert dao.count() == 3
+
+    dao.clear_all()
+    assert dao.count() == 0
+
+
+def test_generation_changes_on_writes(dao: HistoryDAO):
+    """Test that every write through the DAO bumps the generation."""
+    seen = [dao.generation]
+    dao.insert("First", "standard")
+    seen.append(dao.generation)
+    dao.insert_many([("Second", "standard", None, None)])
+    seen.append(dao.generation)
+    dao.clear_all()
+    seen.append(dao.generation)
+    dao.search("first")
+    seen.append(dao.generation)
+
+    assert len(set(seen)) == 4
+    assert seen[-1] == seen[-2]
+    dao.insert("Third", "standard")
+    assert dao.last_generation == seen[-1] + 1
+
+
 def test_delete_older_than(dao: HistoryDAO):
     """Test deleting utterances older than specified days."""
     # Insert old utterance by manually manipulating created_utc
@@ -232,6 +336,112 @@ def test_fts_triggers_on_delete(dao: HistoryDAO):
     assert len(results) == 0
 
 
+def test_fts_triggers_on_update(dao: HistoryDAO):
+    """Test that FTS index drops the old text when a row is edited."""
+    utterance_id = dao.insert("Original wording", "standard")
+
+    dao._conn.execute(
+        "UPDATE utterances SET text = ? WHERE id = ?", ("Revised wording", utterance_id)
+    )
+    dao._conn.commit()
+
+    assert dao.search("original") == []
+    assert [u.id for u in dao.search("revised")] == [utterance_id]
+    dao._conn.execute(
+        "INSERT INTO utterances_fts(utterances_fts, rank) VALUES ('integrity-check', 1)"
+    )
+
+
+def test_migration_rebuilds_stale_fts_index(temp_db: Path):
+    """Test that upgrading a v1 database drops tokens left by the old triggers."""
+    from app.history import SCHEMA_VERSION
+
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    # Recreate the v1 state: index entry kept for text that has since changed
+    dao._conn.executescript(
+        """
+        DROP TRIGGER utterances_au;
+        CREATE TRIGGER utterances_au AFTER UPDATE ON utterances BEGIN
+            UPDATE utterances_fts SET text = new.text WHERE rowid = old.id;
+        END;
+        UPDATE metadata SET value = '1' WHERE key = 'schema_version';
+        """
+    )
+    utterance_id = dao.insert("Stale wording", "standard")
+    dao._conn.execute(
+        "UPDATE utterances SET text = 'Fresh wording' WHERE id = ?", (utterance_id,)
+    )
+    dao._conn.commit()
+    assert [u.id for u in dao.search("stale")] == [utterance_id]
+    dao.close()
+
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    assert dao.search("stale") == []
+    assert [u.id for u in dao.search("fresh")] == [utterance_id]
+    row = dao._conn.execute(
+        "SELECT value FROM metadata WHERE key = 'schema_version'"
+    ).fetchone()
+    assert int(row[0]) == SCHEMA_VERSION
+    dao.close()
+
+
+def test_migration_adds_fts_prefix_index(temp_db: Path):
+    """Test that upgrading a v2 database recreates the FTS table with prefixes."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao._conn.executescript(
+        """
+        DROP TABLE utterances_fts;
+        CREATE VIRTUAL TABLE utterances_fts USING fts5(
+            text, content=utterances, content_rowid=id
+        );
+        UPDATE metadata SET value = '2' WHERE key = 'schema_version';
+        """
+    )
+    utterance_id = dao.insert("Prefix indexed", "standard")
+    dao.close()
+
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    (sql,) = dao._conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'utterances_fts'"
+    ).fetchone()
+    assert "prefix='2 3 4'" in sql
+    assert [u.id for u in dao.search("pre")] == [utterance_id]
+    assert [u.id for u in dao.search("index")] == [utterance_id]
+    dao.close()
+
+
+def test_migration_installs_bulk_aware_insert_trigger(temp_db: Path):
+    """Test that upgrading a v3 database lets bulk inserts skip the trigger."""
+    from app.history.dao import BULK_FTS_MIN_ROWS
+
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao._conn.executescript(
+        """
+        DROP TRIGGER utterances_ai;
+        CREATE TRIGGER utterances_ai AFTER INSERT ON utterances BEGIN
+            INSERT INTO utterances_fts(rowid, text) VALUES (new.id, new.text);
+        END;
+        UPDATE metadata SET value = '3' WHERE key = 'schema_version';
+        """
+    )
+    dao.close()
+
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    rows = [(f"Bulk row {i}", "standard", None, None) for i in range(BULK_FTS_MIN_ROWS)]
+    dao.insert_many(rows)
+    dao._conn.execute(
+        "INSERT INTO utterances_fts(utterances_fts, rank) VALUES ('integrity-check', 1)"
+    )
+    assert len(dao.search("bulk", limit=1000)) == BULK_FTS_MIN_ROWS
+    dao.close()
+
+
 def test_dao_raises_if_not_opened():
     """Test that DAO methods raise if database is not opened."""
     dao = HistoryDAO(Path("test.db"))
@@ -246,6 +456,60 @@ def test_dao_raises_if_not_opened():
         dao.search("test")
 
 
+def test_reads_do_not_wait_for_write_lock(dao: HistoryDAO):
+    """Test that reads use pooled connections instead of the writer's lock."""
+    dao.insert("Readable while locked", "standard")
+    lock_held = threading.Event()
+    release = threading.Event()
+
+    def hold_write_lock() -> None:
+        with dao._lock:
+            lock_held.set()
+            release.wait(timeout=5)
+
+    holder = threading.Thread(target=hold_write_lock)
+    holder.start()
+    try:
+        assert lock_held.wait(timeout=5)
+        assert [u.text for u in dao.get_recent()] == ["Readable while locked"]
+        assert len(dao.search("readable")) == 1
+    finally:
+        release.set()
+        holder.join()
+
+
+def test_close_discards_pooled_readers(temp_db: Path):
+    """Test that close() closes idle read connections and reopen works."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao.get_recent()
+    pooled = dao._idle_readers.get_nowait()
+    dao._idle_readers.put(pooled)
+
+    dao.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        pooled.execute("SELECT 1")
+    dao.open()
+    assert dao.get_recent() == []
+    dao.close()
+
+
+def test_pooled_readers_are_query_only(temp_db: Path):
+    """Test that pooled read connections reject writes."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao.insert("Kept", "standard")
+    dao.get_recent()
+    reader = dao._idle_readers.get_nowait()
+
+    with pytest.raises(sqlite3.OperationalError, match="readonly"):
+        reader.execute("DELETE FROM utterances")
+    reader.close()
+    assert dao.count() == 1
+    dao.close()
+
+
 def test_multiple_modes(dao: HistoryDAO):
     """Test storing utterances with different cleanup modes."""
     dao.insert("Conservative text", "conservative")
@@ -289,6 +553,62 @@ def test_schema_version_stored(temp_db: Path):
     dao.close()
 
 
+def test_close_refreshes_planner_statistics(temp_db: Path):
+    """Test that close() runs PRAGMA optimize so indexed tables get stats."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao.insert_many([(f"Row {i}", "standard", None, None) for i in range(500)])
+    # Retention deletes seek idx_utterances_created on the writer connection
+    dao.delete_older_than(90)
+    dao.close()
+
+    conn = sqlite3.connect(temp_db)
+    try:
+        stats = conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+    finally:
+        conn.close()
+    assert ("utterances",) in stats
+
+
+def test_close_survives_optimize_failure(temp_db: Path):
+    """Test that close() still closes everything when PRAGMA optimize fails."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao.get_recent()
+    reader = dao._idle_readers.get_nowait()
+    dao._idle_readers.put(reader)
+    writer = MagicMock(wraps=dao._conn)
+    writer.execute.side_effect = sqlite3.OperationalError("database is locked")
+    dao._conn = writer
+
+    dao.close()
+
+    writer.close.assert_called_once()
+    assert dao._conn is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        reader.execute("SELECT 1")
+
+
+def test_count_and_generation_see_writes_from_another_dao(temp_db: Path):
+    """Test that a clear through a second DAO is not hidden by cached state."""
+    dao = HistoryDAO(temp_db)
+    dao.open()
+    dao.insert_many([(f"Row {i}", "standard", None, None) for i in range(3)])
+    assert dao.count() == 3
+    generation = dao.generation
+
+    other = HistoryDAO(temp_db)
+    other.open()
+    other.clear_all()
+    other.close()
+
+    assert dao.count() == 0
+    assert dao.generation != generation
+    generation = dao.generation
+    assert dao.generation == generation
+    dao.close()
+
+
 def test_database_persists_after_close(temp_db: Path):
     """Test that data persists after closing and reopening."""
     dao1 = HistoryDAO(temp_db)
@@ -142,6 +142,36 @@ def test_export_to_json_serializable(dao: HistoryDAO) -> None:
     assert parsed[0]["text"] == "Test utterance"
 
 
+def test_export_to_json_streams_valid_document(dao: HistoryDAO, tmp_path: Path) -> None:
+    """export_to_json writes a JSON document matching export_all_to_dict."""
+    dao.insert(text="Hello 世界", mode="standard", duration_ms=1200)
+    dao.insert(text="Second", mode="raw", raw_text="second")
+
+    path = tmp_path / "export.json"
+    written = dao.export_to_json(path)
+
+    content = path.read_text(encoding="utf-8")
+    parsed = json.loads(content)
+    assert written == 2
+    assert list(parsed) == ["exported_at", "count", "utterances"]
+    assert parsed["count"] == 2
+    assert parsed["utterances"] == dao.export_all_to_dict()
+    # Byte-for-byte what json.dump(..., indent=2, ensure_ascii=False) writes
+    assert content == json.dumps(parsed, indent=2, ensure_ascii=False)
+
+
+def test_export_to_json_empty(dao: HistoryDAO, tmp_path: Path) -> None:
+    """export_to_json writes an empty list when there is no history."""
+    path = tmp_path / "empty.json"
+
+    assert dao.export_to_json(path) == 0
+    content = path.read_text(encoding="utf-8")
+    parsed = json.loads(content)
+    assert parsed["count"] == 0
+    assert parsed["utterances"] == []
+    assert content == json.dumps(parsed, indent=2, ensure_ascii=False)
+
+
 def test_export_dao_not_opened() -> None:
     """Export raises if database not opened."""
     dao = HistoryDAO(Path("dummy.db"))
@@ -179,7 +209,7 @@ def test_iter_utterances_single_batch(dao: HistoryDAO) -> None:
 
 
 def test_iter_utterances_multiple_batches(dao: HistoryDAO) -> None:
-    """iter_utterances batches results correctly with LIMIT/OFFSET."""
+    """iter_utterances batches results correctly with keyset pagination."""
     count = 250
     for i in range(count):
         dao.insert(text=f"Utterance {i}", mode="standard", duration_ms=i * 10)
@@ -193,6 +223,28 @@ def test_iter_utterances_multiple_batches(dao: HistoryDAO) -> None:
     assert len(ids) == len(set(ids))
 
 
+def test_iter_utterances_pages_across_timestamp_ties(dao: HistoryDAO) -> None:
+    """iter_utterances returns newest first without skipping tied timestamps."""
+    for i in range(7):
+        dao.insert(text=f"Utterance {i}", mode="standard")
+    # Spread rows over three timestamps so batches split inside a tie
+    dao._conn.execute("UPDATE utterances SET created_utc = 100 + (id - 1) / 3")
+    dao._conn.commit()
+
+    result = list(dao.iter_utterances(batch_size=2))
+
+    assert [item["created_utc"] for item in result] == [
+        102,
+        101,
+        101,
+        101,
+        100,
+        100,
+        100,
+    ]
+    assert sorted(item["id"] for item in result) == list(range(1, 8))
+
+
 def test_iter_utterances_consistency_with_export_all(dao: HistoryDAO) -> None:
     """iter_utterances produces same result as export_all_to_dict."""
     for i in range(50):
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import time
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
 from app.history import HistoryDAO, HistoryPalette
+from app.history.dao import Utterance
 
 
 @pytest.fixture
@@ -212,3 +213,374 @@ def test_case_insensitive_search(dao: HistoryDAO):
     assert len(results_upper) == 1
     assert len(results_mixed) == 1
     assert results_lower[0].text == results_upper[0].text == results_mixed[0].text
+
+
+def test_search_worker_runs_only_latest_query():
+    """Test that queries superseded while queued are never sent to the DAO."""
+    dao = MagicMock()
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+
+    palette._search_queue.put("pyt")
+    palette._search_queue.put("pyth")
+    palette._run_search("python")
+    worker = palette._search_thread
+    palette._on_close()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    dao.search.assert_called_once()
+    assert dao.search.call_args.args == ("python",)
+    assert dao.search.call_args.kwargs["limit"] == 50
+
+
+def test_search_skips_unchanged_query():
+    """Test that key releases which leave the text unchanged do not search."""
+    dao = MagicMock()
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._search_entry = MagicMock()
+    palette._search_entry.get.return_value = " python "
+    palette._last_query = "python"
+
+    palette._on_search_change()
+
+    assert palette._search_thread is None
+    dao.search.assert_not_called()
+
+
+def _utterances(count: int) -> list[Utterance]:
+    return [
+        Utterance(i, f"Utterance {i}", 1_700_000_000 + i, 1000 * i, "standard", None)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def ctk(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace customtkinter in the palette with mocks, one per widget."""
+    import app.history.palette as palette_module
+
+    ctk = MagicMock()
+    for name in ("CTkFrame", "CTkButton", "CTkLabel"):
+        getattr(ctk, name).side_effect = lambda *args, **kwargs: MagicMock()
+    monkeypatch.setattr(palette_module, "ctk", ctk)
+    return ctk
+
+
+def test_update_results_reuses_row_widgets(ctk: MagicMock):
+    """Test that result rows are created once and reconfigured afterwards."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+
+    palette._current_results = _utterances(3)
+    palette._update_results()
+    created = ctk.CTkButton.call_count
+    assert created == 3
+
+    palette._current_results = _utterances(2)
+    palette._update_results()
+    assert len(palette._result_buttons) == 2
+    assert not palette._result_rows[2].visible
+
+    palette._current_results = _utterances(3)
+    palette._update_results()
+    assert ctk.CTkButton.call_count == created
+    # Rows share the window's fonts instead of creating their own
+    ctk.CTkFont.assert_not_called()
+    assert len(palette._result_buttons) == 3
+    assert all(row.visible for row in palette._result_rows)
+
+
+def test_update_results_skips_unchanged_rows(ctk: MagicMock):
+    """Test that rows already showing an utterance are not reconfigured."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+    palette._current_results = _utterances(2)
+    palette._update_results()
+    row = palette._result_rows[1]
+    assert row.meta_label.configure.call_args.kwargs["text"].endswith(
+        "1.0s   •  standard"
+    )
+    row.button.configure.reset_mock()
+    row.meta_label.configure.reset_mock()
+
+    palette._current_results = _utterances(2)
+    palette._update_results()
+    row.meta_label.configure.assert_not_called()
+
+    changed = _utterances(2)
+    changed[1].text = "Edited"
+    palette._current_results = changed
+    palette._update_results()
+    row.button.configure.assert_any_call(text="Edited")
+    row.meta_label.configure.assert_not_called()
+
+
+def test_identical_search_results_keep_selection(ctk: MagicMock):
+    """Test that a search returning the rows on screen does not rebuild them."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+    palette._search_entry = MagicMock()
+    palette._search_entry.get.return_value = "utterance"
+    palette._status_label = MagicMock()
+    palette._update_search_results(_utterances(3), "utterance")
+    palette._select_item(2)
+    palette._status_label.configure.reset_mock()
+
+    palette._update_search_results(_utterances(3), "utterance")
+
+    assert palette._selected_index == 2
+    palette._status_label.configure.assert_not_called()
+
+
+def test_repeated_query_served_from_cache():
+    """Test that a query seen recently is answered without the DAO."""
+    dao = MagicMock()
+    dao.last_generation = 0
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+    results = _utterances(2)
+    palette._on_search_done(results, "utter", 0)
+
+    palette._run_search("utter")
+
+    assert palette._search_thread is None
+    dao.search.assert_not_called()
+    palette._update_search_results.assert_called_with(results, "utter")
+
+
+def test_search_cache_evicts_oldest_query():
+    """Test that the search cache stays bounded."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+
+    for i in range(palette.SEARCH_CACHE_SIZE + 1):
+        palette._on_search_done([], f"query {i}", 0)
+
+    assert len(palette._search_cache) == palette.SEARCH_CACHE_SIZE
+    assert "query 0" not in palette._search_cache
+
+
+def test_write_txt_export(tmp_path: Path):
+    """Test the TXT export writer used by the background export thread."""
+    dao = HistoryDAO(tmp_path / "export.db")
+    dao.open()
+    dao.insert("Exported line", "standard", duration_ms=1500, raw_text="exported")
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+
+    out = tmp_path / "history.txt"
+    assert palette._write_txt_export(str(out)) == 1
+    dao.close()
+
+    content = out.read_text(encoding="utf-8")
+    assert "Text: Exported line\n" in content
+    assert "Duration: 1500ms\n" in content
+    assert "Raw: exported\n" in content
+
+
+def test_longer_query_narrows_complete_cached_results():
+    """Test that extending a query filters a complete cached result set."""
+    dao = MagicMock()
+    dao.last_generation = 0
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+    first, second = _utterances(2)
+    second.text = "Café au lait"
+    palette._on_search_done([first, second], "u", 0)
+
+    palette._run_search("utterance 0")
+    palette._run_search("u caf")
+
+    dao.search.assert_not_called()
+    assert palette._search_cache["utterance 0"] == [first]
+    assert palette._search_cache["u caf"] == []
+    assert palette._search_thread is None
+    assert palette._folded_tokens[1] == ["cafe", "au", "lait"]
+
+
+def test_truncated_results_are_not_narrowed():
+    """Test that a result set cut off at the limit is re-queried."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+    palette._on_search_done(_utterances(palette.SEARCH_LIMIT), "u", 0)
+
+    assert palette._narrow_cached_results("utterance") is None
+    assert palette._narrow_cached_results("é") is None
+
+
+def test_fold_tokens_matches_fts_tokenizer(dao: HistoryDAO):
+    """Test that client-side token folding agrees with the FTS index."""
+    from app.history.palette import _fold_tokens
+
+    text = "Naïve café_owner's RÉSUMÉ v2"
+    dao.insert(text, "standard")
+    for token in _fold_tokens(text):
+        assert any(u.text == text for u in dao.search(token)), token
+    assert _fold_tokens(text) == ["naive", "cafe", "owner", "s", "resume", "v2"]
+
+
+def test_search_worker_drops_superseded_results():
+    """Test that results are not posted when a newer query is already queued."""
+    dao = MagicMock()
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._root = MagicMock()
+
+    def search(query: str, limit: int, cancel):
+        assert not cancel()
+        # Closing the palette queues None, which supersedes this search
+        palette._search_queue.put(None)
+        assert cancel()
+        return []
+
+    dao.search.side_effect = search
+    palette._run_search("older")
+    palette._search_thread.join(timeout=5)
+
+    dao.search.assert_called_once()
+    palette._root.after.assert_not_called()
+
+
+def test_held_arrow_keys_repaint_selection_once(ctk: MagicMock):
+    """Test that rapid selection changes collapse into one highlight pass."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+    palette._current_results = _utterances(5)
+    palette._update_results()
+    first = palette._result_buttons[0]
+    palette._root = MagicMock()
+    for button in palette._result_buttons:
+        button.configure.reset_mock()
+
+    palette._on_down()
+    palette._on_down()
+    palette._on_down()
+
+    assert palette._selected_index == 3
+    palette._root.after_idle.assert_called_once()
+    palette._root.after_idle.call_args.args[0]()
+    first.configure.assert_called_once_with(fg_color="transparent")
+    palette._result_buttons[3].configure.assert_called_once_with(
+        fg_color=("gray80", "gray25")
+    )
+    for index in (1, 2, 4):
+        palette._result_buttons[index].configure.assert_not_called()
+
+
+def test_preload_recent_posts_results_to_ui(dao: HistoryDAO):
+    """Test that recent history loaded off-thread is shown via root.after."""
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._root = MagicMock()
+    palette._update_results = MagicMock()
+
+    palette._preload_recent(limit=2)
+
+    assert palette._current_results == []
+    palette._root.after.assert_called_once()
+    palette._root.after.call_args.args[1]()
+    assert [u.text for u in palette._current_results] == [
+        "Test driven development",
+        "Open source software",
+    ]
+    palette._update_results.assert_called_once()
+
+
+def test_update_results_fills_rows_in_batches(ctk: MagicMock):
+    """Test that long result lists are filled a batch at a time."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+    palette._root = MagicMock()
+    batch = palette.RESULT_BATCH
+    palette._current_results = _utterances(2 * batch + 5)
+
+    palette._update_results()
+    assert len(palette._result_rows) == batch
+    pump = palette._root.after.call_args.args[1]
+
+    pump()
+    assert len(palette._result_rows) == 2 * batch
+    pump()
+    assert len(palette._result_rows) == 2 * batch + 5
+    assert palette._root.after.call_count == 2
+    assert all(row.visible for row in palette._result_rows)
+
+
+def test_new_results_cancel_pending_batches(ctk: MagicMock):
+    """Test that a new update stops filling rows for the previous results."""
+    palette = HistoryPalette(dao=MagicMock(), on_copy=MagicMock(), on_paste=MagicMock())
+    palette._results_frame = MagicMock()
+    palette._root = MagicMock()
+    palette._current_results = _utterances(palette.RESULT_BATCH + 1)
+    palette._update_results()
+    pending = palette._pump_after_id
+
+    palette._current_results = _utterances(3)
+    palette._update_results()
+
+    palette._root.after_cancel.assert_called_once_with(pending)
+    assert palette._pump_after_id is None
+    assert [row.visible for row in palette._result_rows].count(True) == 3
+
+
+def test_search_cache_dropped_after_history_changes(dao: HistoryDAO):
+    """Test that utterances recorded while the palette is open are searchable."""
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+    palette._on_search_done(dao.search("python"), "python", dao.generation)
+    assert "python" in palette._search_cache
+
+    dao.insert("Python generators", "standard")
+    palette._run_search("python")
+
+    assert "python" not in palette._search_cache
+    palette._search_queue.put(None)
+    palette._search_thread.join(timeout=5)
+
+
+def test_cache_check_leaves_dao_lock_to_the_worker(dao: HistoryDAO):
+    """Test that the UI thread never reads the locking generation property."""
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+    palette._update_search_results = MagicMock()
+    palette._on_search_done(dao.search("python"), "python", dao.generation)
+    palette._search_thread = MagicMock()  # keep the worker out of the patch
+    generation = PropertyMock(side_effect=AssertionError("read on UI thread"))
+
+    with patch.object(HistoryDAO, "generation", generation):
+        palette._run_search("python")
+        assert palette._search_queue.empty()
+        dao.insert("Python generators", "standard")
+        palette._run_search("python")
+
+    assert "python" not in palette._search_cache
+    assert palette._search_queue.get_nowait() == "python"
+
+
+def test_cleared_search_lists_recent_off_the_ui_thread():
+    """Test that an emptied search box loads recents via the worker and cache."""
+    dao = MagicMock()
+    dao.generation = dao.last_generation = 0
+    palette = HistoryPalette(dao=dao, on_copy=MagicMock(), on_paste=MagicMock())
+
+    def get_recent(limit: int) -> list[Utterance]:
+        palette._search_queue.put(None)
+        return _utterances(3)
+
+    dao.get_recent.side_effect = get_recent
+    palette._search_entry = MagicMock()
+    palette._search_entry.get.return_value = ""
+    palette._last_query = "python"
+    palette._update_results = MagicMock()
+    palette._update_status = MagicMock()
+
+    palette._on_search_change()
+    worker = palette._search_thread
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    dao.get_recent.assert_called_once_with(limit=50)
+    dao.search.assert_not_called()
+    palette._on_search_done(_utterances(3), "", 0)
+    palette._update_status.assert_called_with("3 recent transcriptions")
+    assert palette._search_cache[""] == _utterances(3)
+
+    palette._last_query = "python"
+    palette._on_search_change()
+    dao.get_recent.assert_called_once()
@@ -80,3 +80,20 @@ def test_search_with_multiple_terms(large_dao: HistoryDAO):
 
     assert len(results) > 0
     assert elapsed_ms < 20, f"Multi-term search took {elapsed_ms:.2f}ms"
+
+
+def test_recent_queries_scan_created_index(large_dao: HistoryDAO):
+    """Test that newest-first reads walk idx_utterances_created without sorting."""
+    plan = large_dao._conn.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT id, text, created_utc, duration_ms, mode, raw_text
+        FROM utterances
+        ORDER BY created_utc DESC
+        LIMIT 50
+        """
+    ).fetchall()
+    details = " ".join(row[3] for row in plan)
+
+    assert "idx_utterances_created" in details
+    assert "TEMP B-TREE" not in details
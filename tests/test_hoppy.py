@@ -6,6 +6,7 @@ import wave
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from app.transcriber.hoppy import (
@@ -179,6 +180,21 @@ def test_transcribe_buffer_custom_sample_rate(mock_onnx_asr) -> None:
     assert result.text == "test transcription"
 
 
+def test_transcribe_audio_passes_waveform_to_model(mock_onnx_asr) -> None:
+    """Test in-memory transcription hands a flat float32 array to the model."""
+    audio = np.zeros((16000, 1), dtype=np.float32)
+
+    transcriber = HoppyTranscriber()
+    result = transcriber.transcribe_audio(audio)
+
+    assert result.text == "test transcription"
+    recognize = mock_onnx_asr.load_model.return_value.recognize
+    waveform = recognize.call_args.args[0]
+    assert waveform.shape == (16000,)
+    assert waveform.dtype == np.float32
+    assert recognize.call_args.kwargs["sample_rate"] == 16000
+
+
 def test_get_transcriber_singleton() -> None:
     """Test singleton pattern for get_transcriber."""
     from app.transcriber.hoppy import get_transcriber
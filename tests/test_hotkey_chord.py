@@ -0,0 +1,60 @@
+"""Tests for hotkey chord parsing and matching."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.hotkey import HotkeyParseError, parse_hotkey
+from app.hotkey.chord import vk_bits
+
+LCTRL, RCTRL, LSHIFT = 0xA2, 0xA3, 0xA0
+
+
+def test_chord_matches_either_side_modifier() -> None:
+    chord = parse_hotkey("ctrl+shift+;")
+
+    assert chord.matches({LCTRL, LSHIFT, 0xBA})
+    assert chord.matches([RCTRL, LSHIFT, 0xBA, 0x41])
+    assert not chord.matches({LCTRL, 0xBA})
+    assert not chord.matches({LCTRL, LSHIFT})
+    assert not chord.matches(set())
+
+
+def test_matches_bits_agrees_with_matches() -> None:
+    chord = parse_hotkey("ctrl+f9")
+    for pressed in ({LCTRL, 0x78}, {RCTRL, 0x78}, {0x78}, {LCTRL}, {LCTRL, 0x77}):
+        assert chord.matches_bits(vk_bits(pressed)) == chord.matches(pressed)
+
+
+def test_chords_compare_by_parsed_fields() -> None:
+    assert parse_hotkey("Ctrl+Shift+A") == parse_hotkey("ctrl + shift + a")
+    assert hash(parse_hotkey("ctrl+a")) == hash(parse_hotkey("CTRL+A"))
+
+
+def test_parse_rejects_modifier_only_chord() -> None:
+    with pytest.raises(HotkeyParseError):
+        parse_hotkey("ctrl+shift")
+
+
+@pytest.mark.parametrize(
+    ("text", "vk"),
+    [("ctrl+;", 0xBA), ("alt+f1", 0x70), ("alt+F24", 0x87), ("ctrl+esc", 0x1B)],
+)
+def test_parse_maps_key_tokens(text: str, vk: int) -> None:
+    assert parse_hotkey(text).key_group == frozenset({vk})
+
+
+def test_parse_maps_single_characters_to_upper_case_codes() -> None:
+    assert parse_hotkey("ctrl+a").key_group == frozenset({ord("A")})
+    assert parse_hotkey("ctrl+7").key_group == frozenset({ord("7")})
+
+
+def test_parse_accepts_zero_padded_function_keys() -> None:
+    assert parse_hotkey("ctrl+F01").key_group == frozenset({0x70})
+    assert parse_hotkey("ctrl+f012").key_group == frozenset({0x7B})
+
+
+def test_parse_rejects_out_of_range_function_key() -> None:
+    for text in ("ctrl+f25", "ctrl+f00", "ctrl+f025"):
+        with pytest.raises(HotkeyParseError):
+            parse_hotkey(text)
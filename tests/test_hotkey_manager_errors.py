@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import queue
+import threading
+import time
+from types import SimpleNamespace
 from typing import Callable
 
 import pytest
 from pynput import keyboard
 
 from app.hotkey import HotkeyCallbacks, HotkeyManager
+from app.hotkey.manager import WM_HOTKEY, WM_QUIT
 
 
 def test_dispatch_handler_error_is_logged(
@@ -174,3 +179,140 @@ def test_dispatch_does_not_reraise(monkeypatch: pytest.MonkeyPatch) -> None:
         manager._dispatch(failing_handler)
     except Exception:
         pytest.fail("_dispatch re-raised an exception")
+
+
+def test_windows_toggle_mode_uses_hotkey_message_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """On Windows, toggle mode reacts to WM_HOTKEY instead of a keyboard hook."""
+    events: list[str] = []
+    loops: list[object] = []
+
+    class StubLoop:
+        def __init__(
+            self,
+            register: Callable[[], None],
+            unregister: Callable[[], None],
+            on_hotkey: Callable[[], None],
+        ) -> None:
+            self.on_hotkey = on_hotkey
+            loops.append(self)
+
+        def start(self) -> None:
+            events.append("loop-start")
+
+        def stop(self) -> None:
+            events.append("loop-stop")
+
+    def listener_factory(*_: object) -> None:
+        raise AssertionError("keyboard hook must not be installed")
+
+    monkeypatch.setattr("app.hotkey.manager.sys.platform", "win32")
+    monkeypatch.setattr("app.hotkey.manager._WindowsHotkeyLoop", StubLoop)
+    monkeypatch.setattr(
+        HotkeyManager, "_ensure_hotkey_available", lambda self, chord: None
+    )
+    callbacks = HotkeyCallbacks(
+        on_record_start=lambda: events.append("start"),
+        on_record_stop=lambda: events.append("stop"),
+        on_request_paste=lambda: events.append("paste"),
+    )
+    manager = HotkeyManager(
+        "CTRL+SHIFT+;",
+        callbacks,
+        toggle_mode=True,
+        listener_factory=listener_factory,  # type: ignore[arg-type]
+    )
+
+    manager.start()
+    loops[0].on_hotkey()  # type: ignore[attr-defined]
+    loops[0].on_hotkey()  # type: ignore[attr-defined]
+    manager.stop()
+
+    assert events == ["loop-start", "start", "stop", "loop-stop"]
+
+
+class _FakeUser32:
+    """Per-thread message queues standing in for the Win32 hotkey APIs."""
+
+    def __init__(self) -> None:
+        self.queues: dict[int, queue.SimpleQueue[int]] = {}
+        self.calls: list[tuple[str, int]] = []
+        self.press_before_quit = False
+
+    def PeekMessageW(self, *_: object) -> int:
+        self.queues.setdefault(threading.get_ident(), queue.SimpleQueue())
+        return 0
+
+    def GetMessageW(self, msg_ref: object, *_: object) -> int:
+        message = self.queues[threading.get_ident()].get(timeout=5)
+        msg_ref._obj.message = message  # type: ignore[attr-defined]
+        return 0 if message == WM_QUIT else 1
+
+    def PostThreadMessageW(self, thread_id: int, message: int, *_: object) -> int:
+        if message == WM_QUIT and self.press_before_quit:
+            # The chord is pressed just as stop() runs
+            self.queues[thread_id].put(WM_HOTKEY)
+        self.queues[thread_id].put(message)
+        return 1
+
+    def RegisterHotKey(self, *_: object) -> int:
+        self.calls.append(("register", threading.get_ident()))
+        return 1
+
+    def UnregisterHotKey(self, *_: object) -> int:
+        self.calls.append(("unregister", threading.get_ident()))
+        return 1
+
+
+def test_windows_press_during_stop_is_ignored(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A WM_HOTKEY queued as stop() runs neither toggles nor stalls the stop."""
+    user32 = _FakeUser32()
+    windll = SimpleNamespace(
+        user32=user32,
+        kernel32=SimpleNamespace(
+            GetCurrentThreadId=threading.get_ident, SetLastError=lambda code: None
+        ),
+    )
+    monkeypatch.setattr("app.hotkey.manager.ctypes.windll", windll, raising=False)
+    monkeypatch.setattr("app.hotkey.manager.sys.platform", "win32")
+    monkeypatch.setattr(
+        HotkeyManager, "_ensure_hotkey_available", lambda self, chord: None
+    )
+    events: list[str] = []
+    callbacks = HotkeyCallbacks(
+        on_record_start=lambda: events.append("start"),
+        on_record_stop=lambda: events.append("stop"),
+        on_request_paste=lambda: events.append("paste"),
+    )
+    manager = HotkeyManager("CTRL+SHIFT+;", callbacks, toggle_mode=True)
+
+    manager.start()
+    loop_thread = manager._listener._thread  # type: ignore[union-attr]
+    user32.press_before_quit = True
+    began = time.monotonic()
+    manager.stop()
+
+    assert time.monotonic() - began < 0.4
+    assert not loop_thread.is_alive()
+    assert events == []
+    # Only the loop thread that registered the chord unregisters it
+    assert user32.calls == [
+        ("register", loop_thread.ident),
+        ("unregister", loop_thread.ident),
+    ]
+
+    # A restarted manager registers afresh and reacts to presses again
+    user32.press_before_quit = False
+    manager.start()
+    loop = manager._listener
+    user32.PostThreadMessageW(loop._thread_id, WM_HOTKEY)  # type: ignore[union-attr]
+    deadline = time.monotonic() + 5
+    while not events and time.monotonic() < deadline:
+        time.sleep(0.01)
+    manager.stop()
+
+    assert events == ["start"]
+    assert [call for call, _ in user32.calls] == ["register", "unregister"] * 2
@@ -0,0 +1,75 @@
+"""Tests for dropping work queued for a superseded recording."""
+
+from __future__ import annotations
+
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from app.__main__ import AppRuntime
+
+
+def _runtime() -> SimpleNamespace:
+    runtime = SimpleNamespace(
+        _recording_active=False,
+        _recording_session=0,
+        _transcribe_timer=None,
+        _idle_timer=None,
+        _settings=SimpleNamespace(transcribe_start_delay_ms=0),
+        _audio_recorder=MagicMock(sample_rate=16000),
+        _transcriber=MagicMock(),
+        _history=MagicMock(),
+        _tray=MagicMock(),
+        _toast_manager=MagicMock(),
+        _submit_io=MagicMock(),
+        _schedule_idle_reset=MagicMock(),
+        _cancel_timer=lambda timer: timer and timer.cancel(),
+        _on_audio_chunk=MagicMock(),
+    )
+    runtime._finalize_recording = partial(AppRuntime._finalize_recording, runtime)
+    runtime._complete_transcription = partial(
+        AppRuntime._complete_transcription, runtime
+    )
+    return runtime
+
+
+def test_recording_started_before_finalize_drops_old_buffer() -> None:
+    runtime = _runtime()
+    AppRuntime._handle_record_start(runtime)
+    AppRuntime._handle_record_stop(runtime)
+    _, _, session = runtime._submit_io.call_args.args
+
+    # A new recording starts before the I/O worker gets to the old one
+    AppRuntime._handle_record_start(runtime)
+    AppRuntime._finalize_recording(runtime, np.zeros(16000, np.float32), session)
+
+    assert runtime._transcribe_timer is None
+
+
+def test_recording_started_before_timer_fires_skips_transcription() -> None:
+    runtime = _runtime()
+    AppRuntime._handle_record_start(runtime)
+    AppRuntime._handle_record_stop(runtime)
+    _, _, session = runtime._submit_io.call_args.args
+    AppRuntime._finalize_recording(runtime, np.zeros(16000, np.float32), session)
+    runtime._transcribe_timer.join(timeout=5)
+    task, audio, timer_session = runtime._submit_io.call_args.args
+
+    AppRuntime._handle_record_start(runtime)
+    AppRuntime._complete_transcription(runtime, audio, timer_session)
+
+    runtime._transcriber.transcribe_file.assert_not_called()
+    runtime._transcriber.transcribe_audio.assert_not_called()
+    runtime._history.insert.assert_not_called()
+
+
+def test_current_session_is_transcribed() -> None:
+    runtime = _runtime()
+    runtime._recording_session = 3
+    runtime._transcriber.transcribe_file.side_effect = RuntimeError("offline")
+
+    AppRuntime._complete_transcription(runtime, np.zeros(1600, np.float32), 3)
+
+    runtime._transcriber.transcribe_file.assert_called_once()
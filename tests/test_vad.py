@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import MagicMock
+
 import numpy as np
 import pytest
 
@@ -105,44 +107,58 @@ def test_vad_trailing_silence_triggers_stop():
 
     # Create actual speech by forcing the internal state
     # In real use, this would be detected by the VAD algorithm
-    vad._has_speech = True
-    vad._silence_frames = 0
+    vad._silence_countdown = vad._silence_threshold
 
     # Now process silence frames
     silent_frame = np.zeros(480, dtype=np.float32)
 
-    # First silence frame: _silence_frames becomes 1
+    # First silence frame: countdown drops to 2
     is_speech_1, should_stop_1 = vad.process_frame(silent_frame)
     assert not is_speech_1
-    assert vad._silence_frames == 1
+    assert vad._silence_countdown == 2
     assert not should_stop_1
 
-    # Second silence frame: _silence_frames becomes 2
+    # Second silence frame: countdown drops to 1
     is_speech_2, should_stop_2 = vad.process_frame(silent_frame)
     assert not is_speech_2
-    assert vad._silence_frames == 2
+    assert vad._silence_countdown == 1
     assert not should_stop_2
 
-    # Third silence frame: _silence_frames becomes 3, should trigger stop
+    # Third silence frame: countdown reaches 0, should trigger stop
     is_speech_3, should_stop_3 = vad.process_frame(silent_frame)
     assert not is_speech_3
-    assert vad._silence_frames == 3
+    assert vad._silence_countdown == 0
     assert should_stop_3
 
+    # Further silence keeps requesting a stop
+    _, should_stop_4 = vad.process_frame(silent_frame)
+    assert should_stop_4
+
+
+def test_vad_process_frame_skips_vad_for_digital_silence():
+    """Test that near-zero frames are classified without calling WebRTC VAD."""
+    vad = VoiceActivityDetector(sample_rate=16000, trailing_silence_ms=30)
+    vad._vad = MagicMock()
+    vad._silence_countdown = 1
+
+    is_speech, should_stop = vad.process_frame(np.full(480, 1e-5, dtype=np.float32))
+
+    assert not is_speech
+    assert should_stop
+    vad._vad.is_speech.assert_not_called()
+
 
 def test_vad_reset_clears_state():
     """Test that reset() clears VAD state."""
     vad = VoiceActivityDetector(sample_rate=16000)
 
     # Set internal state
-    vad._has_speech = True
-    vad._silence_frames = 5
+    vad._silence_countdown = 2
 
     # Reset
     vad.reset()
 
-    assert not vad._has_speech
-    assert vad._silence_frames == 0
+    assert vad._silence_countdown == -1
 
 
 def test_vad_process_frame_with_2d_array():
@@ -214,6 +230,32 @@ def test_vad_process_buffer_handles_incomplete_final_frame():
     assert not has_speech
 
 
+def test_vad_process_buffer_matches_frame_by_frame():
+    """Test that batched buffer conversion agrees with per-frame processing."""
+    rng = np.random.default_rng(7)
+    buffer = np.concatenate(
+        [
+            np.zeros(4800, dtype=np.float32),
+            (rng.standard_normal(9600) * 0.4).astype(np.float32),
+            np.zeros(1000, dtype=np.float32),
+        ]
+    )
+
+    reference = VoiceActivityDetector(sample_rate=16000, aggressiveness=1)
+    frame_size = reference.frame_size
+    expected = sum(
+        reference.process_frame(buffer[i : i + frame_size])[0]
+        for i in range(0, len(buffer) - frame_size + 1, frame_size)
+    )
+
+    # WebRTC VAD keeps internal state, so compare against fresh instances
+    assert expected > 0
+    vad = VoiceActivityDetector(sample_rate=16000, aggressiveness=1)
+    assert vad.process_buffer(buffer, min_speech_frames=expected)
+    vad = VoiceActivityDetector(sample_rate=16000, aggressiveness=1)
+    assert not vad.process_buffer(buffer, min_speech_frames=expected + 1)
+
+
 def test_vad_float32_to_pcm16_conversion():
     """Test float32 to PCM16 conversion."""
     vad = VoiceActivityDetector()
@@ -224,6 +266,7 @@ def test_vad_float32_to_pcm16_conversion():
 
     assert pcm16.dtype == np.int16
     assert pcm16[0] == -32767
+    assert pcm16[1] == -16384  # -16383.5 rounds to nearest even
     assert pcm16[2] == 0
     assert pcm16[4] == 32767
 
@@ -240,6 +283,17 @@ def test_vad_float32_to_pcm16_clipping():
     assert pcm16[1] == 32767  # Clipped from 2.0
 
 
+def test_vad_float32_to_pcm16_into_scratch_matches_allocating_path():
+    """Test that converting into the frame scratch buffers gives the same PCM."""
+    vad = VoiceActivityDetector()
+
+    frame = np.linspace(-1.5, 1.5, vad.frame_size, dtype=np.float32)
+    pcm16 = vad._float32_to_pcm16(frame, vad._scratch_f32, vad._scratch_i16)
+
+    assert pcm16 is vad._scratch_i16
+    np.testing.assert_array_equal(pcm16, vad._float32_to_pcm16(frame))
+
+
 def test_create_vad_factory():
     """Test create_vad factory function."""
     vad = create_vad(